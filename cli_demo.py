@@ -4,47 +4,83 @@ Simple CLI Demo - Create and Test Two Agents Communicating
 
 This script demonstrates the complete workflow of creating two agents
 and setting them up for communication via CLI commands.
+
+StrandsFlow must be installed first (``pip install -e .`` from the
+repository root).
 """
 
+import shlex
+import shutil
 import subprocess
 import sys
 import os
 import time
 from pathlib import Path
 
+try:
+    from strandsflow.core.yaml_cache import load_yaml
+except ImportError as e:
+    sys.exit(
+        f"❌ Could not import StrandsFlow: {e}\n"
+        "Install it first with `pip install -e .` from the repository root."
+    )
+
+_SEP = "=" * 50
+
+
+def _banner(title):
+    """Format a section header framed by separator lines."""
+    return f"\n{_SEP}\n{title}\n{_SEP}"
+
+
+class WorkspaceCache:
+    """Parsed agent configs for one workspace, loaded on first access."""
+    
+    def __init__(self, workspace):
+        self._workspace = Path(workspace)
+        self._configs = {}
+    
+    def get(self, agent):
+        """Return the parsed config for an agent, or None if it has none."""
+        if agent not in self._configs:
+            config_file = self._workspace / f"{agent}_config.yaml"
+            try:
+                self._configs[agent] = load_yaml(str(config_file))
+            except FileNotFoundError:
+                self._configs[agent] = None
+        return self._configs[agent]
+    
+    def peers(self, agent):
+        """Return the A2A peers configured for an agent."""
+        config = self.get(agent)
+        return config['a2a']['peers'] if config else []
+
 def run_cli_command(cmd, description):
-    """Run a CLI command with proper environment setup."""
+    """Run a CLI command and report whether it succeeded."""
     print(f"\n🔧 {description}")
     print(f"💻 Command: {cmd}")
     print("-" * 60)
     
-    # Set up environment
-    env = os.environ.copy()
-    env['PYTHONPATH'] = "/Users/annmariyajoshy/vibecoding/strands_agent/src:" + env.get('PYTHONPATH', '')
-    
-    # Run command
-    result = subprocess.run(cmd, shell=True, env=env)
+    # Run command directly, without an intermediate shell
+    result = subprocess.run(shlex.split(cmd))
     return result.returncode == 0
 
 def main():
     """Demonstrate CLI workflow for multi-agent communication."""
     
     print("🚀 StrandsFlow CLI Multi-Agent Demo")
-    print("="*50)
+    print(_SEP)
     print("This demo shows how to create two agents and enable A2A communication using CLI commands.")
     print()
     
     # Clean up any existing workspace
     workspace = "cli_demo"
     if Path(workspace).exists():
-        import shutil
         shutil.rmtree(workspace)
         print(f"🧹 Cleaned up existing workspace: {workspace}")
     
     # Step 1: Create two agents
-    print("\\n" + "="*50)
-    print("STEP 1: Create Two Agents")
-    print("="*50)
+    print(_banner("STEP 1: Create Two Agents"))
     
     success = run_cli_command(
         f"python -m strandsflow multiagent create --agents assistant,researcher --workspace {workspace} --base-port 8030",
@@ -55,40 +91,34 @@ def main():
         print("❌ Failed to create agents. Check your setup.")
         return
     
-    print("\\n✅ Successfully created two agents!")
+    print("\n✅ Successfully created two agents!")
     print("📁 Generated files:")
-    for file in Path(workspace).iterdir():
-        if file.is_file():
-            print(f"   • {file.name}")
+    with os.scandir(workspace) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                print(f"   • {entry.name}")
     
     # Step 2: Test agent configuration
-    print("\\n" + "="*50)
-    print("STEP 2: Test Agent Configuration")  
-    print("="*50)
+    print(_banner("STEP 2: Test Agent Configuration"))
     
     # Show agent configs
-    print("\\n📋 Agent Configurations:")
-    import yaml
-    
-    for agent in ["assistant", "researcher"]:
-        config_file = Path(workspace) / f"{agent}_config.yaml"
-        if config_file.exists():
-            with open(config_file) as f:
-                config = yaml.safe_load(f)
-            
-            print(f"\\n🤖 {agent.title()} Agent:")
+    print("\n📋 Agent Configurations:")
+    workspace_cache = WorkspaceCache(workspace)
+    
+    for agent in ("assistant", "researcher"):
+        config = workspace_cache.get(agent)
+        if config:
+            print(f"\n🤖 {agent.title()} Agent:")
             print(f"   • Name: {config['agent']['name']}")
             print(f"   • API Port: {config['api']['port']}")
             print(f"   • A2A Port: {config['a2a']['server_port']}")
             print(f"   • Agent ID: {config['a2a']['agent_id']}")
-            print(f"   • Peers: {len(config['a2a']['peers'])} configured")
+            print(f"   • Peers: {len(workspace_cache.peers(agent))} configured")
     
     # Step 3: Show communication commands
-    print("\\n" + "="*50)
-    print("STEP 3: Agent Communication Commands")
-    print("="*50)
+    print(_banner("STEP 3: Agent Communication Commands"))
     
-    print("\\n💬 Available CLI Commands:")
+    print("\n💬 Available CLI Commands:")
     
     commands = [
         {
@@ -114,37 +144,30 @@ def main():
     ]
     
     for i, cmd_info in enumerate(commands, 1):
-        print(f"\\n{i}. {cmd_info['desc']}")
+        print(f"\n{i}. {cmd_info['desc']}")
         print(f"   Command: {cmd_info['cmd']}")
     
     # Step 4: Test CLI commands (without starting servers)
-    print("\\n" + "="*50)
-    print("STEP 4: Test CLI Commands (Dry Run)")
-    print("="*50)
+    print(_banner("STEP 4: Test CLI Commands (Dry Run)"))
     
-    print("\\n🧪 Testing chat command (will show that agents aren't running):")
+    print("\n🧪 Testing chat command (will show that agents aren't running):")
     
     # Test the chat command - it should detect agents aren't running
-    env = os.environ.copy()
-    env['PYTHONPATH'] = "/Users/annmariyajoshy/vibecoding/strands_agent/src:" + env.get('PYTHONPATH', '')
-    
-    # Use echo to simulate quitting immediately
-    cmd = f"echo 'q' | python -m strandsflow multiagent chat --workspace {workspace} --agent1 assistant --agent2 researcher"
+    # Feed 'q' on stdin to simulate quitting immediately
+    cmd = f"python -m strandsflow multiagent chat --workspace {workspace} --agent1 assistant --agent2 researcher"
     
-    print(f"💻 Running: {cmd}")
+    print(f"💻 Running: echo 'q' | {cmd}")
     print("-" * 40)
     
-    result = subprocess.run(cmd, shell=True, env=env, capture_output=True, text=True)
+    result = subprocess.run(shlex.split(cmd), input="q\n", capture_output=True, text=True)
     print(result.stdout)
     if result.stderr:
         print(f"Errors: {result.stderr}")
     
     # Step 5: Summary and next steps
-    print("\\n" + "="*50)
-    print("STEP 5: Summary & Next Steps")
-    print("="*50)
+    print(_banner("STEP 5: Summary & Next Steps"))
     
-    print("\\n✅ Successfully demonstrated:")
+    print("\n✅ Successfully demonstrated:")
     achievements = [
         "Created two specialized agents (assistant & researcher)",
         "Configured A2A communication between agents",
@@ -156,7 +179,7 @@ def main():
     for achievement in achievements:
         print(f"   ✓ {achievement}")
     
-    print("\\n🎯 To enable full communication:")
+    print("\n🎯 To enable full communication:")
     next_steps = [
         "Configure AWS credentials (aws configure)",
         f"Start agents: cd {workspace} && python start_agents.py",
@@ -168,13 +191,15 @@ def main():
     for i, step in enumerate(next_steps, 1):
         print(f"   {i}. {step}")
     
-    print(f"\\n📂 Workspace created: {Path(workspace).absolute()}")
-    print("🔗 API docs (when running): http://localhost:8030/docs")
+    print(f"\n📂 Workspace created: {Path(workspace).absolute()}")
+    assistant_config = workspace_cache.get("assistant")
+    api_port = assistant_config['api']['port'] if assistant_config else 8030
+    print(f"🔗 API docs (when running): http://localhost:{api_port}/docs")
     
-    print("\\n" + "="*50)
+    print(f"\n{_SEP}")
     print("CLI DEMO COMPLETE! 🎉")
     print("You can now create agents and make them communicate via CLI!")
-    print("="*50)
+    print(_SEP)
 
 if __name__ == "__main__":
     main()
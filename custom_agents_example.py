@@ -2,10 +2,12 @@
 Custom Agent Implementation Example
 """
 
-import asyncio
+import functools
+import os
 from typing import Dict, List, Optional, Any
 from strandsflow.core.agent import StrandsFlowAgent
 from strandsflow.core.config import StrandsFlowConfig
+from strandsflow.core.eventloop import run
 
 
 class DataAnalysisAgent(StrandsFlowAgent):
@@ -13,7 +15,7 @@ class DataAnalysisAgent(StrandsFlowAgent):
     Custom agent specialized for data analysis tasks.
     """
     
-    def __init__(self, config: Optional[StrandsFlowConfig] = None):
+    def __init__(self, config: Optional[StrandsFlowConfig] = None, boto_session: Optional[Any] = None):
         # Custom system prompt for data analysis
         custom_system_prompt = """
         You are DataBot, an expert data analyst and visualization specialist.
@@ -36,7 +38,8 @@ class DataAnalysisAgent(StrandsFlowAgent):
         
         super().__init__(
             config=config,
-            system_prompt=custom_system_prompt
+            system_prompt=custom_system_prompt,
+            boto_session=boto_session
         )
         
         # Add custom initialization
@@ -104,18 +107,14 @@ class DataAnalysisAgent(StrandsFlowAgent):
             Generated report as markdown string
         """
         try:
-            # Gather selected analyses
-            selected_analyses = [
-                self.analysis_history[i] for i in analysis_ids 
-                if i < len(self.analysis_history)
-            ]
-            
-            # Create report prompt
-            analyses_summary = "\n\n".join([
+            # Summarize the selected analyses in a single pass
+            history = self.analysis_history
+            selected_analyses = (history[j] for j in analysis_ids if j < len(history))
+            analyses_summary = "\n\n".join(
                 f"Analysis {i}: {analysis['analysis_type']} on {analysis['data_path']}\n"
                 f"Results: {analysis['result'][:500]}..."
                 for i, analysis in enumerate(selected_analyses)
-            ])
+            )
             
             prompt = f"""
             Create a comprehensive data analysis report based on these analyses:
@@ -176,7 +175,7 @@ class CodeReviewAgent(StrandsFlowAgent):
     Custom agent specialized for code review and analysis.
     """
     
-    def __init__(self, config: Optional[StrandsFlowConfig] = None):
+    def __init__(self, config: Optional[StrandsFlowConfig] = None, boto_session: Optional[Any] = None):
         custom_system_prompt = """
         You are CodeReviewer, an expert software engineer specializing in code quality and security.
         
@@ -197,7 +196,8 @@ class CodeReviewAgent(StrandsFlowAgent):
         
         super().__init__(
             config=config,
-            system_prompt=custom_system_prompt
+            system_prompt=custom_system_prompt,
+            boto_session=boto_session
         )
         
         self.review_history = []
@@ -247,40 +247,59 @@ class CodeReviewAgent(StrandsFlowAgent):
         }
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config(config_path: str, mtime_ns: int) -> StrandsFlowConfig:
+    """Load and validate a config file; the mtime key invalidates stale entries."""
+    return StrandsFlowConfig.from_file(config_path)
+
+
 # Factory function for creating custom agents
-def create_custom_agent(agent_type: str, config_path: str = None) -> StrandsFlowAgent:
+def create_custom_agent(
+    agent_type: str,
+    config_path: str = None,
+    boto_session: Optional[Any] = None
+) -> StrandsFlowAgent:
     """
     Factory function to create different types of custom agents.
     
     Args:
         agent_type: Type of agent to create
         config_path: Path to custom configuration file
+        boto_session: Shared boto3 session to reuse instead of creating a new one
         
     Returns:
         Custom agent instance
     """
     # Load custom config if provided
     if config_path:
-        config = StrandsFlowConfig.from_file(config_path)
+        config = _load_config(config_path, os.stat(config_path).st_mtime_ns)
     else:
         config = StrandsFlowConfig()
     
     # Create appropriate agent type
     if agent_type == "data_analysis":
-        return DataAnalysisAgent(config)
+        return DataAnalysisAgent(config, boto_session=boto_session)
     elif agent_type == "code_review":
-        return CodeReviewAgent(config)
+        return CodeReviewAgent(config, boto_session=boto_session)
     else:
         # Default StrandsFlow agent with custom config
-        return StrandsFlowAgent(config)
+        return StrandsFlowAgent(config, boto_session=boto_session)
 
 
 # Example usage
 async def main():
     """Example of using custom agents."""
+    import boto3
+    
+    config_path = "custom_agent_config.yaml"
+    region_name = _load_config(config_path, os.stat(config_path).st_mtime_ns).bedrock.region_name
+    
+    # Resolve AWS credentials once and share them between both agents; the
+    # session's region overrides each agent's configured region, so pin it
+    session = boto3.Session(region_name=region_name)
     
     # Create a data analysis agent
-    data_agent = create_custom_agent("data_analysis", "custom_agent_config.yaml")
+    data_agent = create_custom_agent("data_analysis", config_path, boto_session=session)
     await data_agent.initialize()
     
     # Perform data analysis
@@ -292,7 +311,7 @@ async def main():
     print("Analysis Result:", result)
     
     # Create a code review agent
-    code_agent = create_custom_agent("code_review")
+    code_agent = create_custom_agent("code_review", boto_session=session)
     await code_agent.initialize()
     
     # Review some code
@@ -313,4 +332,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
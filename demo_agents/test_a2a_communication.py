@@ -6,24 +6,81 @@ Test A2A Communication Between Agents
 import asyncio
 import httpx
 import json
+import orjson
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_delay, wait_exponential
 from pathlib import Path
+from typing import NamedTuple
+
+from strandsflow.core.eventloop import run
+
+class AgentEndpoint(NamedTuple):
+    """Connection details for one agent, with its URLs formatted once."""
+    type: str
+    title: str
+    api_port: int
+    a2a_port: int
+    agent_id: str
+    health_url: str
+    chat_url: str
+    orchestrate_url: str
+
+def _endpoint(agent):
+    base_url = f"http://localhost:{agent['api_port']}"
+    return AgentEndpoint(
+        agent["type"], agent["type"].title(), agent["api_port"], agent["a2a_port"], agent["agent_id"],
+        f"{base_url}/health", f"{base_url}/chat", f"{base_url}/multiagent/orchestrate"
+    )
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+AGENTS = tuple(_endpoint(agent) for agent in [{"type": "assistant", "config_file": "demo_agents/assistant_config.yaml", "api_port": 8020, "a2a_port": 8120, "agent_id": "assistant_agent"}, {"type": "researcher", "config_file": "demo_agents/researcher_config.yaml", "api_port": 8021, "a2a_port": 8121, "agent_id": "researcher_agent"}, {"type": "writer", "config_file": "demo_agents/writer_config.yaml", "api_port": 8022, "a2a_port": 8122, "agent_id": "writer_agent"}])
+
+# One pooled client for the whole run so the orchestration request reuses the
+# keep-alive connection opened by the health checks.
+_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60),
+    timeout=httpx.Timeout(5.0),
+)
+
+async def probe_health(agent):
+    """GET an agent's health endpoint, retrying briefly while it is still starting."""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_delay(5),
+        wait=wait_exponential(multiplier=0.05, max=0.5),
+        retry=retry_if_exception_type(httpx.ConnectError),
+        reraise=True
+    ):
+        with attempt:
+            return await _CLIENT.get(agent.health_url)
+
+async def read_preview(response, limit=100):
+    """Read a response body and return its ``response`` text shortened for display."""
+    body = await response.aread()
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        text = body.decode("utf-8", errors="replace")
+    else:
+        text = str(data.get('response', 'No response')) if isinstance(data, dict) else str(data)
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 async def test_a2a_communication():
     """Test agent-to-agent communication."""
     
-    agents = [{"type": "assistant", "config_file": "demo_agents/assistant_config.yaml", "api_port": 8020, "a2a_port": 8120, "agent_id": "assistant_agent"}, {"type": "researcher", "config_file": "demo_agents/researcher_config.yaml", "api_port": 8021, "a2a_port": 8121, "agent_id": "researcher_agent"}, {"type": "writer", "config_file": "demo_agents/writer_config.yaml", "api_port": 8022, "a2a_port": 8122, "agent_id": "writer_agent"}]
-    
     print("🧪 Testing A2A Communication...")
     
-    async with httpx.AsyncClient() as client:
-        # Test each agent's health
-        for agent in agents:
-            try:
-                response = await client.get(f"http://localhost:{agent['api_port']}/health")
+    try:
+        # Test each agent's health concurrently
+        results = await asyncio.gather(
+            *[probe_health(agent) for agent in AGENTS],
+            return_exceptions=True
+        )
+        for agent, response in zip(AGENTS, results):
+            if isinstance(response, Exception):
+                print(f"❌ {agent.title} Agent: {response}")
+            else:
                 status = "✅" if response.status_code == 200 else "❌"
-                print(f"{status} {agent['type'].title()} Agent (port {agent['api_port']})")
-            except Exception as e:
-                print(f"❌ {agent['type'].title()} Agent: {e}")
+                print(f"{status} {agent.title} Agent (port {agent.api_port})")
         
         # Test orchestrated communication
         print("\n🤝 Testing orchestrated communication...")
@@ -32,24 +89,27 @@ async def test_a2a_communication():
             # Example: Get researcher to help assistant
             message = "I need research on the latest AI trends in 2024. Can you help?"
             
-            response = await client.post(
-                f"http://localhost:8020/multiagent/orchestrate",
-                json={
+            async with _CLIENT.stream(
+                "POST",
+                AGENTS[0].orchestrate_url,
+                content=orjson.dumps({
                     "task": message,
                     "required_agents": ["researcher"],
                     "session_id": "test-session"
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Orchestrated communication successful!")
-                print(f"Response: {result.get('response', 'No response')[:100]}...")
-            else:
-                print(f"❌ Orchestration failed: {response.status_code}")
+                }),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status_code == 200:
+                    preview = await read_preview(response)
+                    print("✅ Orchestrated communication successful!")
+                    print(f"Response: {preview}")
+                else:
+                    print(f"❌ Orchestration failed: {response.status_code}")
                 
         except Exception as e:
             print(f"❌ Orchestration error: {e}")
+    finally:
+        await _CLIENT.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(test_a2a_communication())
+    run(test_a2a_communication())
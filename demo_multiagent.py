@@ -9,22 +9,37 @@ This script demonstrates:
 5. Complex multi-agent tasks
 """
 
-import asyncio
-import sys
-import os
+import logging
 import time
+from typing import List
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from strandsflow.core.config import StrandsFlowConfig
+from strandsflow.core.eventloop import run
 
-async def demo_basic_multiagent():
+logger = logging.getLogger(__name__)
+
+
+def _preview(text: str, limit: int = 200) -> str:
+    """Shorten agent output for display, marking it only when cut."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def _add_specialists(orchestrator, pool) -> List[str]:
+    """Add every pool specialist to the orchestrator in one pass and return their names."""
+    configs = pool.configs
+    for name, agent in pool.specialists.items():
+        specialist_config = configs[name]
+        orchestrator.add_specialist(name, agent, specialist_config.role, specialist_config.capabilities)
+    return list(pool.specialists)
+
+
+async def demo_basic_multiagent(config: StrandsFlowConfig):
     """Demonstrate basic multi-agent functionality."""
     print("🤖 StrandsFlow Multi-Agent Demo")
     print("=" * 50)
     
     try:
         # Import core modules
-        from strandsflow.core.config import StrandsFlowConfig
         from strandsflow.core.agent import StrandsFlowAgent
         
         print("✓ Core modules imported")
@@ -40,8 +55,6 @@ async def demo_basic_multiagent():
             print(f"⚠️  Multi-agent features not available: {e}")
             return
         
-        # Create configuration
-        config = StrandsFlowConfig()
         print(f"✓ Configuration loaded (Model: {config.bedrock.model_id})")
         
         # Create specialist pool
@@ -64,25 +77,17 @@ async def demo_basic_multiagent():
         code_expert = pool.get_specialist("Code Expert")
         if code_expert:
             response = await code_expert.chat("What are the SOLID principles in software development?")
-            print(f"Code Expert: {response[:200]}...")
+            print(f"Code Expert: {_preview(response)}")
         
-        # Create A2A manager
+        # Create A2A manager and orchestrator
         print("\n🔗 Setting up A2A communication...")
         a2a_manager = A2AServerManager()
-        
-        # Add specialists to A2A manager
-        for name, agent in pool.specialists.items():
-            a2a_server = a2a_manager.add_agent(agent, name)
-            print(f"✓ Added {name} to A2A network")
-        
-        # Create orchestrator
-        print("\n🎭 Creating orchestrator...")
         orchestrator = Orchestrator(a2a_manager=a2a_manager)
         
-        # Add specialists to orchestrator
-        for name, agent in pool.specialists.items():
-            config_obj = pool.configs[name]
-            orchestrator.add_specialist(name, agent, config_obj.role, config_obj.capabilities)
+        # Add specialists to orchestrator (this also registers them on the A2A network)
+        print("\n🎭 Creating orchestrator...")
+        for name in _add_specialists(orchestrator, pool):
+            print(f"✓ Added {name} to A2A network")
         
         # Create orchestrator agent
         orchestrator.create_orchestrator_agent()
@@ -99,7 +104,7 @@ async def demo_basic_multiagent():
         
         print(f"✓ Orchestrator routed task:")
         print(f"  Task: {task}")
-        print(f"  Result: {result['routing_decision'][:200]}...")
+        print(f"  Result: {_preview(result['routing_decision'])}")
         
         # Test workflow manager
         print("\n📋 Testing workflow manager...")
@@ -115,13 +120,11 @@ async def demo_basic_multiagent():
         
         print("\n🎉 Multi-agent demo completed successfully!")
         
-    except Exception as e:
-        print(f"❌ Demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Demo failed")
 
 
-async def demo_workflow_execution():
+async def demo_workflow_execution(config: StrandsFlowConfig):
     """Demonstrate workflow execution."""
     print("\n" + "=" * 50)
     print("📋 Workflow Execution Demo")
@@ -132,10 +135,8 @@ async def demo_workflow_execution():
             WorkflowManager, Orchestrator, A2AServerManager,
             create_predefined_pool, WorkflowDefinition, WorkflowStep
         )
-        from strandsflow.core.config import StrandsFlowConfig
         
         # Setup
-        config = StrandsFlowConfig()
         pool = await create_predefined_pool(config)
         await pool.initialize_all()
         
@@ -143,9 +144,7 @@ async def demo_workflow_execution():
         orchestrator = Orchestrator(a2a_manager=a2a_manager)
         
         # Add specialists
-        for name, agent in pool.specialists.items():
-            config_obj = pool.configs[name]
-            orchestrator.add_specialist(name, agent, config_obj.role, config_obj.capabilities)
+        _add_specialists(orchestrator, pool)
         
         # Create workflow manager
         workflow_manager = WorkflowManager(orchestrator, pool)
@@ -165,41 +164,27 @@ async def demo_workflow_execution():
         
         print(f"✓ Workflow started with ID: {execution_id}")
         
-        # Monitor execution
+        # Monitor execution, printing each step as it completes
         print("\n⏳ Monitoring workflow execution...")
+        print("📊 Results:")
         
-        for i in range(30):  # Wait up to 30 seconds
-            await asyncio.sleep(1)
-            
-            execution = workflow_manager.get_execution_status(execution_id)
-            if execution:
-                print(f"  Status: {execution.status.value} | Current step: {execution.current_step}")
-                
-                if execution.status.value in ["completed", "failed"]:
-                    break
-        
-        # Get final results
+        async for step_name, step_result in workflow_manager.stream_results(execution_id, timeout=30):
+            if isinstance(step_result, dict) and "output" in step_result:
+                print(f"  {step_name}: {_preview(step_result['output'], 100)}")
+        
+        # Get final status
         final_execution = workflow_manager.get_execution_status(execution_id)
         if final_execution:
             print(f"\n✓ Workflow {final_execution.status.value}")
-            
-            if final_execution.status.value == "completed":
-                print("📊 Results:")
-                if final_execution.results and "steps" in final_execution.results:
-                    for step_name, step_result in final_execution.results["steps"].items():
-                        if isinstance(step_result, dict) and "output" in step_result:
-                            print(f"  {step_name}: {step_result['output'][:100]}...")
         
         # Cleanup
         await pool.shutdown_all()
         
-    except Exception as e:
-        print(f"❌ Workflow demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Workflow demo failed")
 
 
-async def demo_parallel_agents():
+async def demo_parallel_agents(config: StrandsFlowConfig):
     """Demonstrate parallel agent execution."""
     print("\n" + "=" * 50)
     print("⚡ Parallel Agent Execution Demo")
@@ -210,10 +195,8 @@ async def demo_parallel_agents():
             Orchestrator, WorkflowType, A2AServerManager,
             create_predefined_pool
         )
-        from strandsflow.core.config import StrandsFlowConfig
         
         # Setup
-        config = StrandsFlowConfig()
         pool = await create_predefined_pool(config)
         await pool.initialize_all()
         
@@ -221,9 +204,7 @@ async def demo_parallel_agents():
         orchestrator = Orchestrator(a2a_manager=a2a_manager)
         
         # Add specialists
-        for name, agent in pool.specialists.items():
-            config_obj = pool.configs[name]
-            orchestrator.add_specialist(name, agent, config_obj.role, config_obj.capabilities)
+        _add_specialists(orchestrator, pool)
         
         # Test parallel execution
         task = "Analyze the pros and cons of microservices architecture"
@@ -250,23 +231,26 @@ async def demo_parallel_agents():
                 agent_name = agent_result.get("agent", "Unknown")
                 output = agent_result.get("output", "No output")
                 print(f"\n{agent_name}:")
-                print(f"  {output[:150]}...")
+                print(f"  {_preview(output, 150)}")
         
         # Cleanup
         await pool.shutdown_all()
         
-    except Exception as e:
-        print(f"❌ Parallel demo failed: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Parallel demo failed")
 
 
 async def main():
     """Run all demos."""
+    logging.basicConfig(level=logging.WARNING)
+    
     print("🚀 StrandsFlow Multi-Agent System Demonstration")
     print("Built on Strands Agents SDK with A2A Communication")
     print("=" * 60)
     
+    # One configuration shared by every demo
+    config = StrandsFlowConfig()
+    
     demos = [
         ("Basic Multi-Agent Setup", demo_basic_multiagent),
         ("Workflow Execution", demo_workflow_execution),
@@ -278,7 +262,7 @@ async def main():
         print("-" * 40)
         
         try:
-            await demo_func()
+            await demo_func(config)
             print(f"✅ {demo_name} completed successfully")
         except Exception as e:
             print(f"❌ {demo_name} failed: {e}")
@@ -290,4 +274,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
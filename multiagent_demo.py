@@ -6,37 +6,58 @@ This script demonstrates how to use the StrandsFlow CLI to create
 and manage multiple agents for agent-to-agent communication.
 """
 
-import subprocess
+import runpy
+import shlex
+import shutil
 import sys
 import os
+import threading
 from pathlib import Path
 
-def run_command(cmd, description, capture_output=False):
-    """Run a command and print results."""
+from strandsflow.cli import app as strandsflow_cli
+
+def run_command(args, description):
+    """Run a strandsflow CLI command in this process and print results."""
     print(f"\n🔧 {description}")
-    print(f"Command: {cmd}")
+    print(f"Command: python -m strandsflow {shlex.join(args)}")
     print("-" * 50)
     
-    # Set environment
-    env = os.environ.copy()
-    env['PYTHONPATH'] = "/Users/annmariyajoshy/vibecoding/strands_agent/src:" + env.get('PYTHONPATH', '')
+    try:
+        exit_code = strandsflow_cli(args, prog_name="strandsflow", standalone_mode=False)
+        return not exit_code
+    except Exception as e:
+        print(f"Error: {e}")
+        return False
+
+def run_script(script, workdir, description):
+    """Run a Python script in this process from the given working directory."""
+    print(f"\n🔧 {description}")
+    print(f"Command: cd {workdir} && python {script}")
+    print("-" * 50)
     
+    script_path = os.path.abspath(script)
+    previous_dir = os.getcwd()
     try:
-        if capture_output:
-            result = subprocess.run(cmd, shell=True, env=env, capture_output=True, text=True)
-            print(result.stdout)
-            if result.stderr:
-                print(f"Errors: {result.stderr}")
-            return result.returncode == 0
-        else:
-            result = subprocess.run(cmd, shell=True, env=env)
-            return result.returncode == 0
+        os.chdir(workdir)
+        runpy.run_path(script_path, run_name="__main__")
+        return True
+    except SystemExit as e:
+        # The script called sys.exit(); only a zero/None status is success
+        return e.code in (None, 0)
     except Exception as e:
         print(f"Error: {e}")
         return False
+    finally:
+        os.chdir(previous_dir)
 
 def main():
     """Main demo function."""
+    # Remove any previous workspace in the background while the intro prints
+    cleanup = threading.Thread(
+        target=shutil.rmtree, args=("demo_agents",), kwargs={"ignore_errors": True}
+    )
+    cleanup.start()
+    
     print("🚀 StrandsFlow Multi-Agent CLI Demo")
     print("="*60)
     print()
@@ -49,15 +70,12 @@ def main():
     
     # Step 1: Clean up any existing test workspace
     print("🧹 Cleaning up previous test workspace...")
-    if Path("demo_agents").exists():
-        import shutil
-        shutil.rmtree("demo_agents")
+    cleanup.join()
     
     # Step 2: Create multi-agent setup
     success = run_command(
-        "python -m strandsflow multiagent create --agents assistant,researcher,writer --workspace demo_agents --base-port 8020",
-        "Creating 3 agents with A2A communication",
-        capture_output=True
+        ["multiagent", "create", "--agents", "assistant,researcher,writer", "--workspace", "demo_agents", "--base-port", "8020"],
+        "Creating 3 agents with A2A communication"
     )
     
     if not success:
@@ -67,18 +85,18 @@ def main():
     # Step 3: Show what was created
     print("\\n📁 Generated files:")
     demo_path = Path("demo_agents")
-    if demo_path.exists():
-        for file in demo_path.iterdir():
-            if file.is_file():
-                print(f"   • {file.name}")
+    # One directory scan serves both listings below
+    with os.scandir(demo_path) as it:
+        files = [entry for entry in it if entry.is_file()]
+    for entry in files:
+        print(f"   • {entry.name}")
     
     # Step 4: Show agent configurations
     print("\\n📋 Agent Configurations:")
-    config_files = list(demo_path.glob("*_config.yaml"))
-    for config_file in config_files:
-        agent_name = config_file.stem.replace("_config", "")
-        if agent_name != "orchestrator":
-            print(f"   • {agent_name.title()} Agent: {config_file}")
+    for entry in files:
+        if entry.name.endswith("_config.yaml") and entry.name != "orchestrator_config.yaml":
+            agent_name = entry.name[:-len("_config.yaml")]
+            print(f"   • {agent_name.title()} Agent: {entry.path}")
     
     # Step 5: Show CLI commands available
     print("\\n🛠️ Available CLI Commands:")
@@ -100,10 +118,10 @@ def main():
     print("\\n🧪 Testing agent configurations...")
     
     # Test that configs are valid
-    success = run_command(
-        "cd demo_agents && python ../test_multiagent/simple_test.py",
-        "Validating agent configurations",
-        capture_output=True
+    success = run_script(
+        "test_multiagent/simple_test.py",
+        "demo_agents",
+        "Validating agent configurations"
     )
     
     # Step 7: Show communication patterns
@@ -3,15 +3,90 @@ Simple Multi-Agent Setup Example for StrandsFlow
 
 This script demonstrates the basic setup and usage of StrandsFlow's
 multi-agent system without requiring AWS credentials.
+
+StrandsFlow must be installed first (``pip install -e .`` from the
+repository root).
 """
 
 import asyncio
+import re
 import sys
-import os
 
-# Add the source directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+try:
+    from strandsflow.multiagent import (
+        SpecialistPool, A2AServerManager, Orchestrator
+    )
+    from strandsflow.multiagent.specialist_pool import SpecialistConfig
+    from strandsflow.core.config import StrandsFlowConfig
+    from strandsflow.core.eventloop import run
+except ImportError as e:
+    sys.exit(
+        f"❌ Could not import StrandsFlow: {e}\n"
+        "Install it first with `pip install -e .` from the repository root."
+    )
+
+
+# Specialists with their roles and capabilities, built once at import time
+_SPECIALISTS: tuple[SpecialistConfig, ...] = tuple(
+    SpecialistConfig(
+        name=name,
+        role=role,
+        description=f"AI {role} specializing in {', '.join(capabilities)}",
+        capabilities=capabilities,
+        system_prompt=system_prompt,
+        model_id="anthropic.claude-3-haiku-20240307-v1:0",  # Faster model
+        temperature=0.7
+    )
+    for name, role, capabilities, system_prompt in (
+        (
+            "Math Expert",
+            "Mathematics Specialist",
+            ["calculations", "statistics", "problem_solving"],
+            "You are a mathematics expert. Solve problems step by step with clear explanations."
+        ),
+        (
+            "Code Expert",
+            "Software Engineer",
+            ["programming", "debugging", "code_review"],
+            "You are a senior software engineer. Write clean, efficient code with best practices."
+        ),
+        (
+            "Writer",
+            "Content Writer",
+            ["writing", "editing", "communication"],
+            "You are a professional content writer. Create clear, engaging content."
+        ),
+    )
+)
+
 
+# Keyword routing table in priority order: when a task mentions keywords for
+# several specialists, the earlier entry wins
+_ROUTES = (
+    ("math", "Math Expert", ("calculate", "interest", "math")),
+    ("code", "Code Expert", ("python", "code", "function", "debug")),
+    ("write", "Writer", ("write", "blog", "post", "content")),
+)
+_ROUTE_PRIORITY = {group: index for index, (group, _, _) in enumerate(_ROUTES)}
+_ROUTE_TARGETS = {group: target for group, target, _ in _ROUTES}
+
+# One compiled pattern with a named group per specialist, so a task is scanned
+# once instead of once per keyword
+_ROUTE_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{group}>{'|'.join(map(re.escape, keywords))})"
+        for group, _, keywords in _ROUTES
+    ),
+    re.IGNORECASE
+)
+
+
+def route_task(task: str, default: str = "Code Expert") -> str:
+    """Pick the specialist for a task from the keywords it contains."""
+    groups = {match.lastgroup for match in _ROUTE_PATTERN.finditer(task)}
+    if not groups:
+        return default
+    return _ROUTE_TARGETS[min(groups, key=_ROUTE_PRIORITY.__getitem__)]
 
 async def simple_multiagent_setup():
     """Demonstrate basic multi-agent setup without actual API calls."""
@@ -19,13 +94,6 @@ async def simple_multiagent_setup():
     print("=" * 40)
     
     try:
-        # Import required modules
-        from strandsflow.multiagent import (
-            SpecialistPool, A2AServerManager, Orchestrator, WorkflowType
-        )
-        from strandsflow.core.config import StrandsFlowConfig
-        from strandsflow.core.agent import StrandsFlowAgent
-        
         print("✓ All modules imported successfully")
         
         # Step 1: Create configuration
@@ -36,51 +104,14 @@ async def simple_multiagent_setup():
         print("\n📚 Creating Specialist Pool...")
         pool = SpecialistPool()
         
-        # Define specialists with their roles and capabilities
-        specialists_config = {
-            "Math Expert": {
-                "role": "Mathematics Specialist",
-                "capabilities": ["calculations", "statistics", "problem_solving"],
-                "system_prompt": "You are a mathematics expert. Solve problems step by step with clear explanations."
-            },
-            "Code Expert": {
-                "role": "Software Engineer", 
-                "capabilities": ["programming", "debugging", "code_review"],
-                "system_prompt": "You are a senior software engineer. Write clean, efficient code with best practices."
-            },
-            "Writer": {
-                "role": "Content Writer",
-                "capabilities": ["writing", "editing", "communication"],
-                "system_prompt": "You are a professional content writer. Create clear, engaging content."
-            }
-        }
+        # Add all specialists to the pool at once
+        await asyncio.gather(*[
+            pool.add_specialist(config=specialist_config, base_config=config)
+            for specialist_config in _SPECIALISTS
+        ])
         
-        # Create and add specialists
-        for name, spec in specialists_config.items():
-            # Import the specialist config class
-            from strandsflow.multiagent.specialist_pool import SpecialistConfig
-            
-            # Create specialist configuration
-            specialist_config = SpecialistConfig(
-                name=name,
-                role=spec["role"],
-                description=f"AI {spec['role']} specializing in {', '.join(spec['capabilities'])}",
-                capabilities=spec["capabilities"],
-                system_prompt=spec["system_prompt"],
-                model_id="anthropic.claude-3-haiku-20240307-v1:0",  # Faster model
-                temperature=0.7
-            )
-            
-            # Create base config
-            base_config = StrandsFlowConfig()
-            
-            # Add to pool
-            agent = await pool.add_specialist(
-                config=specialist_config,
-                base_config=base_config
-            )
-            
-            print(f"  ✓ Added {name}")
+        for specialist_config in _SPECIALISTS:
+            print(f"  ✓ Added {specialist_config.name}")
         
         print(f"✓ Created {len(pool.specialists)} specialists")
         
@@ -113,14 +144,7 @@ async def simple_multiagent_setup():
         
         for task in sample_tasks:
             # Simulate routing decision based on task content
-            if any(word in task.lower() for word in ["calculate", "interest", "math"]):
-                routed_to = "Math Expert"
-            elif any(word in task.lower() for word in ["python", "code", "function", "debug"]):
-                routed_to = "Code Expert"
-            elif any(word in task.lower() for word in ["write", "blog", "post", "content"]):
-                routed_to = "Writer"
-            else:
-                routed_to = "Code Expert"  # Default
+            routed_to = route_task(task)
             
             print(f"  📝 Task: {task}")
             print(f"     → Routed to: {routed_to}")
@@ -216,5 +240,5 @@ if __name__ == "__main__":
     print("Built on Strands Agents SDK with A2A Communication")
     print("=" * 60)
     
-    asyncio.run(simple_multiagent_setup())
-    asyncio.run(show_api_integration())
+    run(simple_multiagent_setup())
+    run(show_api_integration())
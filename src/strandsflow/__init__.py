@@ -2,44 +2,37 @@
 StrandsFlow: AI Agent Platform with AWS Bedrock and MCP Integration
 
 A production-ready AI agent platform built on the Strands Agents SDK,
-featuring AWS Bedrock model integration, extensible tooling via 
+featuring AWS Bedrock model integration, extensible tooling via
 the Model Context Protocol (MCP), and multi-agent orchestration.
+
+Public names are imported lazily on first access (PEP 562), so importing
+the package does not load the Strands/Bedrock stack until it is needed.
 """
 
-from .core.config import StrandsFlowConfig, BedrockConfig, MCPConfig, AgentConfig, APIConfig
-from .core.agent import StrandsFlowAgent
-
-# Multi-agent imports (optional, graceful degradation if dependencies missing)
-try:
-    from .multiagent import (
-        A2AServer, A2AServerManager, A2AClient,
-        Orchestrator, WorkflowType,
-        SpecialistPool, SpecialistConfig, create_predefined_pool,
-        WorkflowManager, WorkflowDefinition, WorkflowStep, WorkflowStatus
-    )
-    MULTIAGENT_AVAILABLE = True
-except ImportError:
-    MULTIAGENT_AVAILABLE = False
+import importlib
+import importlib.util
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "0.1.0"
 
-# Core exports
-__all__ = [
-    "StrandsFlowConfig",
-    "BedrockConfig", 
-    "MCPConfig",
-    "AgentConfig",
-    "APIConfig",
-    "StrandsFlowAgent",
-]
-
-# Multi-agent exports (if available)
-if MULTIAGENT_AVAILABLE:
-    __all__.extend([
+# Public name -> submodule that defines it
+_CORE_EXPORTS = {
+    "StrandsFlowConfig": ".core.config",
+    "BedrockConfig": ".core.config",
+    "MCPConfig": ".core.config",
+    "AgentConfig": ".core.config",
+    "APIConfig": ".core.config",
+    "StrandsFlowAgent": ".core.agent",
+}
+
+# Multi-agent exports (optional, graceful degradation if dependencies missing)
+_MULTIAGENT_EXPORTS = {
+    name: ".multiagent"
+    for name in (
         "A2AServer",
-        "A2AServerManager", 
+        "A2AServerManager",
         "A2AClient",
-        "Orchestrator", 
+        "Orchestrator",
         "WorkflowType",
         "SpecialistPool",
         "SpecialistConfig",
@@ -47,5 +40,55 @@ if MULTIAGENT_AVAILABLE:
         "WorkflowManager",
         "WorkflowDefinition",
         "WorkflowStep",
-        "WorkflowStatus"
-    ])
\ No newline at end of file
+        "WorkflowStatus",
+        "batch_spawn",
+    )
+}
+
+# Only advertise multi-agent names when their dependencies are installed, so
+# ``from strandsflow import *`` keeps working in a minimal install
+__all__ = list(_CORE_EXPORTS)
+if all(importlib.util.find_spec(module) is not None for module in ("strands", "strands_tools")):
+    __all__.extend(_MULTIAGENT_EXPORTS)
+
+if TYPE_CHECKING:
+    from .core.config import StrandsFlowConfig, BedrockConfig, MCPConfig, AgentConfig, APIConfig
+    from .core.agent import StrandsFlowAgent
+    from .multiagent import (
+        A2AServer, A2AServerManager, A2AClient,
+        Orchestrator, WorkflowType,
+        SpecialistPool, SpecialistConfig, create_predefined_pool,
+        WorkflowManager, WorkflowDefinition, WorkflowStep, WorkflowStatus,
+        batch_spawn
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access and cache them on the module."""
+    if name == "MULTIAGENT_AVAILABLE":
+        try:
+            importlib.import_module(".multiagent", __name__)
+            value = True
+        except ImportError:
+            value = False
+    elif name in _MULTIAGENT_EXPORTS:
+        try:
+            module = importlib.import_module(_MULTIAGENT_EXPORTS[name], __name__)
+        except ImportError as e:
+            # AttributeError keeps hasattr() and getattr(..., default) working
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} (multi-agent dependencies missing: {e})"
+            ) from e
+        value = getattr(module, name)
+    elif name in _CORE_EXPORTS:
+        module = importlib.import_module(_CORE_EXPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | {"MULTIAGENT_AVAILABLE"})
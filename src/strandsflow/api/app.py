@@ -1,35 +1,53 @@
 """FastAPI application for StrandsFlow."""
 
 import asyncio
+import importlib.util
 import logging
+import itertools
 import os
-import json
-from typing import Dict, List, Optional, Any
-from uuid import uuid4, UUID
+import secrets
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Optional, Set, Any
 
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+import orjson
 import structlog
 
-from ..core.agent import StrandsFlowAgent
+try:
+    import ormsgpack
+except ImportError:
+    ormsgpack = None
+
 from ..core.config import StrandsFlowConfig
+from .sessions import InMemorySessionStore, create_session_store
 
-# Configure structured logging
+# The agent and multi-agent stacks pull in strands and boto3, so they are
+# imported when first used rather than when this module is loaded
+if TYPE_CHECKING:
+    from ..core.agent import StrandsFlowAgent
+    from ..multiagent import Orchestrator, SpecialistPool, WorkflowManager, A2AServerManager
+
+def _orjson_serializer(obj: Any, **kwargs: Any) -> bytes:
+    """Serialize log events with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, default=kwargs.get("default", str))
+
+# Configure structured logging: events are filtered by level before any
+# processing and written as orjson bytes, bypassing the stdlib logging lock
 structlog.configure(
     processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
+        structlog.processors.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
         structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_serializer)
     ],
     context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    wrapper_class=structlog.stdlib.BoundLogger,
+    logger_factory=structlog.BytesLoggerFactory(),
+    wrapper_class=structlog.make_filtering_bound_logger(os.getenv("LOG_LEVEL", "info").lower()),
     cache_logger_on_first_use=True,
 )
 
@@ -37,7 +55,10 @@ logger = structlog.get_logger(__name__)
 
 # Pydantic models for API
 class MessageRequest(BaseModel):
-    content: str
+    # Malformed or oversized payloads are rejected before they reach the agent
+    model_config = ConfigDict(extra="forbid")
+    
+    content: str = Field(..., min_length=1, max_length=32_000)
     session_id: Optional[str] = None
 
 class MessageResponse(BaseModel):
@@ -69,56 +90,204 @@ class MetricsResponse(BaseModel):
     uptime_seconds: float
     agent_metrics: Dict[str, Any]
 
+async def parse_message_request(request: Request) -> MessageRequest:
+    """Validate a chat request straight from the raw JSON body.
+    
+    pydantic-core parses and validates the bytes in one pass, instead of
+    FastAPI decoding the body with the json module and then validating the
+    resulting dict.
+    """
+    try:
+        return MessageRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+# Keeps the request body documented for routes that parse it themselves
+MESSAGE_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": MessageRequest.model_json_schema()}}
+    }
+}
+
 # Global variables
 config: Optional[StrandsFlowConfig] = None
-agent: Optional[StrandsFlowAgent] = None
-sessions: Dict[str, Dict[str, Any]] = {}
+agent: Optional["StrandsFlowAgent"] = None
+# Replaced at startup by a Redis-backed store when api.redis_url is set
+sessions = InMemorySessionStore()
 
 # Metrics tracking
 import time
-start_time = time.time()
+# Monotonic so uptime is unaffected by wall-clock adjustments
+start_time = time.monotonic()
 total_messages_processed = 0
 
+# Conversation ids only need to be unique, not unguessable: process id plus a counter
+_conversation_ids = itertools.count(1)
+_pid = os.getpid()
+
+# Seconds a broadcast waits on one connection before dropping it as stalled
+BROADCAST_SEND_TIMEOUT = 5.0
+
 # WebSocket connection manager
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.session_connections: Dict[str, List[WebSocket]] = {}
-
-    async def connect(self, websocket: WebSocket, session_id: str = None):
-        await websocket.accept()
-        self.active_connections.append(websocket)
+    def __init__(self, broadcast_batch_size: int = 50):
+        self.active_connections: Set[WebSocket] = set()
+        self.session_connections: Dict[str, Set[WebSocket]] = {}
+        self.broadcast_batch_size = broadcast_batch_size
+
+    async def connect(self, websocket: WebSocket, session_id: str = None, subprotocol: Optional[str] = None):
+        await websocket.accept(subprotocol=subprotocol)
+        self.active_connections.add(websocket)
         if session_id:
-            if session_id not in self.session_connections:
-                self.session_connections[session_id] = []
-            self.session_connections[session_id].append(websocket)
+            self.session_connections.setdefault(session_id, set()).add(websocket)
 
     def disconnect(self, websocket: WebSocket, session_id: str = None):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        if session_id and session_id in self.session_connections:
-            if websocket in self.session_connections[session_id]:
-                self.session_connections[session_id].remove(websocket)
-            if not self.session_connections[session_id]:
+        self.active_connections.discard(websocket)
+        connections = self.session_connections.get(session_id) if session_id else None
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del self.session_connections[session_id]
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
     async def broadcast_to_session(self, message: str, session_id: str):
-        if session_id in self.session_connections:
-            for connection in self.session_connections[session_id]:
-                await connection.send_text(message)
+        connections = list(self.session_connections.get(session_id, ()))
+        if not connections:
+            return
+        
+        # Send to a batch of connections at once so one slow client doesn't hold
+        # up the rest, yielding between batches so large fan-outs don't starve
+        # other requests on this worker
+        batch_size = self.broadcast_batch_size
+        for start in range(0, len(connections), batch_size):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + batch_size]
+            results = await asyncio.gather(
+                *[
+                    asyncio.wait_for(connection.send_text(message), BROADCAST_SEND_TIMEOUT)
+                    for connection in batch
+                ],
+                return_exceptions=True
+            )
+            for connection, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.warning("Dropping failed WebSocket connection", session_id=session_id, error=str(result))
+                    self.disconnect(connection, session_id)
 
 manager = ConnectionManager()
 
+# Clients offering this WebSocket subprotocol exchange msgpack binary frames
+# instead of JSON text frames; the message schema is the same for both
+MSGPACK_SUBPROTOCOL = "strandsflow.msgpack"
+
+def _encode_frame(payload: Dict[str, Any], use_msgpack: bool = False) -> Dict[str, Any]:
+    """Build the ASGI message sending a payload as msgpack or JSON."""
+    if use_msgpack:
+        return {"type": "websocket.send", "bytes": ormsgpack.packb(payload)}
+    return {"type": "websocket.send", "text": orjson.dumps(payload).decode()}
+
+async def _send_payload(websocket: WebSocket, payload: Dict[str, Any], use_msgpack: bool = False) -> None:
+    """Send a payload as one frame in the connection's encoding."""
+    await websocket.send(_encode_frame(payload, use_msgpack))
+
+async def _receive_payload(websocket: WebSocket, use_msgpack: bool = False) -> Any:
+    """Receive one text or binary frame and decode it.
+    
+    Binary frames are parsed straight from bytes; orjson validates UTF-8
+    while parsing, so no separate decode pass is needed.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    raw = message.get("bytes")
+    if raw is None:
+        return orjson.loads(message["text"])
+    return ormsgpack.unpackb(raw) if use_msgpack else orjson.loads(raw)
+
+# Upper bound on the text merged into a single streamed chunk frame
+MAX_CHUNK_FRAME_CHARS = 4096
+
+def _chunk_frame_encoder(session_id: str, use_msgpack: bool = False) -> Callable[[str], Dict[str, Any]]:
+    """Return a function building the ASGI message for one chunk frame.
+    
+    For JSON, everything except the content is encoded once up front, so
+    each frame only encodes its text and concatenates.
+    """
+    if use_msgpack:
+        return lambda content: _encode_frame(
+            {"type": "chunk", "content": content, "session_id": session_id}, True
+        )
+    
+    prefix = '{"type":"chunk","session_id":' + orjson.dumps(session_id).decode() + ',"content":'
+    return lambda content: {
+        "type": "websocket.send",
+        "text": prefix + orjson.dumps(content).decode() + "}"
+    }
+
+async def _stream_chunks(
+    websocket: WebSocket,
+    session_id: str,
+    chunks: AsyncIterator[Any],
+    use_msgpack: bool = False
+) -> str:
+    """Forward streamed response chunks to the client and return the full text.
+    
+    A sender task drains a queue of chunks; whatever piled up while the
+    previous frame was being sent goes out as one frame, so fast token streams
+    use fewer frames without delaying a chunk when the socket keeps up. The
+    full text is assembled from the sent frames, so it is built from one
+    piece per frame rather than one per chunk.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    sent_frames: List[str] = []
+    encode_chunk = _chunk_frame_encoder(session_id, use_msgpack)
+    
+    async def sender() -> None:
+        while True:
+            text = await queue.get()
+            if text is None:
+                return
+            batch = [text]
+            size = len(text)
+            finished = False
+            while size < MAX_CHUNK_FRAME_CHARS and not queue.empty():
+                text = queue.get_nowait()
+                if text is None:
+                    finished = True
+                    break
+                batch.append(text)
+                size += len(text)
+            
+            content = "".join(batch)
+            await websocket.send(encode_chunk(content))
+            sent_frames.append(content)
+            if finished:
+                return
+    
+    sender_task = asyncio.create_task(sender())
+    try:
+        async for chunk in chunks:
+            if sender_task.done():
+                break
+            queue.put_nowait(chunk if type(chunk) is str else str(chunk))
+    finally:
+        queue.put_nowait(None)
+        await sender_task
+    
+    return "".join(sent_frames)
+
 # FastAPI app
 app = FastAPI(
     title="StrandsFlow API",
     description="AI Agent Platform built on Strands Agents SDK with AWS Bedrock and MCP integration",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware immediately
@@ -130,22 +299,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses such as session histories; server-sent event
+# streams are left uncompressed by the middleware
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+@lru_cache(maxsize=1)
 def get_config() -> StrandsFlowConfig:
-    """Get the global config instance."""
+    """Get the global config instance (resolved once, then cached)."""
     global config
     if config is None:
         # Try to load from file first, then fall back to environment
-        config_file = "strandsflow.yaml"
-        if os.path.exists(config_file):
-            config = StrandsFlowConfig.from_file(config_file)
-        else:
+        try:
+            config = StrandsFlowConfig.from_file("strandsflow.yaml")
+        except FileNotFoundError:
             config = StrandsFlowConfig.from_env()
     return config
 
-def get_agent() -> StrandsFlowAgent:
-    """Get the global agent instance."""
+@lru_cache(maxsize=1)
+def get_agent() -> "StrandsFlowAgent":
+    """Get the global agent instance (created once, then cached)."""
     global agent
     if agent is None:
+        from ..core.agent import StrandsFlowAgent
+        
         agent_config = get_config()
         agent = StrandsFlowAgent(agent_config)
     return agent
@@ -153,12 +329,27 @@ def get_agent() -> StrandsFlowAgent:
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application on startup."""
+    global sessions
+    
     try:
         logger.info("Starting StrandsFlow API...")
         
         # Load configuration
         app_config = get_config()
-        logger.info("Configuration loaded", config=app_config.model_dump())
+        logger.info("Configuration loaded", model_id=app_config.bedrock.model_id)
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Full configuration", config=app_config.model_dump())
+        
+        # Set up session storage
+        sessions = create_session_store(
+            redis_url=app_config.api.redis_url,
+            max_sessions=app_config.api.max_sessions,
+            max_messages=app_config.agent.max_conversation_turns,
+            ttl=app_config.api.session_ttl,
+            max_connections=app_config.api.redis_max_connections
+        )
+        logger.info("Session store ready", store=type(sessions).__name__)
+        manager.broadcast_batch_size = app_config.api.broadcast_batch_size
         
         # Initialize agent
         app_agent = get_agent()
@@ -170,7 +361,22 @@ async def startup_event():
         logger.error("Failed to start StrandsFlow API", error=str(e))
         raise
 
-@app.get("/health", response_model=HealthResponse)
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release application resources on shutdown."""
+    await sessions.close()
+
+# Health probes only ever return one of two bodies, so both are encoded once
+_HEALTH_BODIES = {
+    agent_ready: orjson.dumps({
+        "status": "healthy" if agent_ready else "degraded",
+        "version": "0.1.0",
+        "agent_ready": agent_ready
+    })
+    for agent_ready in (True, False)
+}
+
+@app.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """Health check endpoint."""
     try:
@@ -179,108 +385,134 @@ async def health_check():
     except Exception:
         agent_ready = False
     
-    return HealthResponse(
-        status="healthy" if agent_ready else "degraded",
-        version="0.1.0",
-        agent_ready=agent_ready
-    )
-
-@app.get("/agent/info", response_model=AgentInfo)
-async def get_agent_info():
+    return Response(content=_HEALTH_BODIES[agent_ready], media_type="application/json")
+
+@lru_cache(maxsize=1)
+def _agent_info_body(app_agent: "StrandsFlowAgent") -> bytes:
+    """Encode the agent's info once; it does not change after the agent is created."""
+    return orjson.dumps({
+        "name": app_agent.config.agent.name,
+        "description": app_agent.config.agent.description,
+        "version": "0.1.0",
+        "model_id": app_agent.config.bedrock.model_id,
+        "max_conversation_turns": app_agent.config.agent.max_conversation_turns
+    })
+
+@app.get("/agent/info", responses={200: {"model": AgentInfo}})
+async def get_agent_info(app_agent: "StrandsFlowAgent" = Depends(get_agent)):
     """Get agent information."""
     try:
-        app_agent = get_agent()
-        return AgentInfo(
-            name=app_agent.config.agent.name,
-            description=app_agent.config.agent.description,
-            version="0.1.0",
-            model_id=app_agent.config.bedrock.model_id,
-            max_conversation_turns=app_agent.config.agent.max_conversation_turns
-        )
+        return Response(content=_agent_info_body(app_agent), media_type="application/json")
     except Exception as e:
         logger.error("Failed to get agent info", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to get agent info: {str(e)}")
 
-@app.post("/chat", response_model=MessageResponse)
-async def chat_with_agent(request: MessageRequest):
+@app.post("/chat", responses={200: {"model": MessageResponse}}, openapi_extra=MESSAGE_REQUEST_OPENAPI)
+async def chat_with_agent(
+    request: MessageRequest = Depends(parse_message_request),
+    app_agent: "StrandsFlowAgent" = Depends(get_agent)
+):
     """Send a message to the agent and get a response."""
     global total_messages_processed
     
     try:
-        app_agent = get_agent()
-        
         # Use provided session_id or create new one
-        session_id = request.session_id or str(uuid4())
-        
-        # Initialize session if new
-        if session_id not in sessions:
-            sessions[session_id] = {
-                "conversation_count": 0,
-                "created_at": "2025-08-08T00:00:00Z",
-                "messages": []
-            }
+        session_id = request.session_id or secrets.token_hex(16)
         
         # Process the message
         response_text = await app_agent.chat(request.content)
         
-        # Update session and metrics
-        sessions[session_id]["conversation_count"] += 1
+        # Update session and metrics (append_message creates the session if new)
+        await sessions.append_message(session_id, request.content, response_text)
         total_messages_processed += 1
-        sessions[session_id]["messages"].append({
-            "user": request.content,
-            "agent": response_text,
-            "timestamp": "2025-08-08T00:00:00Z"
-        })
         
-        return MessageResponse(
-            response=response_text,
-            session_id=session_id,
-            conversation_id=str(uuid4())
-        )
+        # Returning the response object skips FastAPI's jsonable_encoder pass
+        return ORJSONResponse({
+            "response": response_text,
+            "session_id": session_id,
+            "conversation_id": f"{_pid:x}-{next(_conversation_ids):x}"
+        })
         
     except Exception as e:
         logger.error("Failed to process chat message", error=str(e), session_id=request.session_id)
         raise HTTPException(status_code=500, detail=f"Failed to process message: {str(e)}")
 
-@app.get("/sessions", response_model=List[SessionInfo])
+def _sse_event(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as one server-sent event."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+@app.post("/chat/stream", openapi_extra=MESSAGE_REQUEST_OPENAPI)
+async def stream_chat_with_agent(
+    request: MessageRequest = Depends(parse_message_request),
+    app_agent: "StrandsFlowAgent" = Depends(get_agent)
+):
+    """Send a message to the agent and stream the response as server-sent events."""
+    session_id = request.session_id or secrets.token_hex(16)
+    await sessions.ensure(session_id)
+    
+    async def event_stream():
+        global total_messages_processed
+        
+        response_chunks = []
+        try:
+            async for chunk in app_agent.chat_async(request.content):
+                chunk_text = chunk if type(chunk) is str else str(chunk)
+                response_chunks.append(chunk_text)
+                yield _sse_event({"type": "chunk", "content": chunk_text})
+        except Exception as e:
+            logger.error("Failed to stream chat message", error=str(e), session_id=session_id)
+            yield _sse_event({"type": "error", "message": f"Error: {str(e)}"})
+            return
+        
+        # Record the exchange once the full response has been sent
+        conversation_count = await sessions.append_message(
+            session_id, request.content, "".join(response_chunks)
+        )
+        total_messages_processed += 1
+        yield _sse_event({
+            "type": "complete",
+            "session_id": session_id,
+            "conversation_count": conversation_count
+        })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Session-Id": session_id}
+    )
+
+@app.get("/sessions", responses={200: {"model": List[SessionInfo]}})
 async def list_sessions():
     """List all active sessions."""
-    return [
-        SessionInfo(
-            session_id=session_id,
-            conversation_count=session_data["conversation_count"],
-            created_at=session_data["created_at"]
-        )
-        for session_id, session_data in sessions.items()
-    ]
+    return ORJSONResponse(await sessions.list_sessions())
 
-@app.get("/sessions/{session_id}", response_model=Dict[str, Any])
-async def get_session(session_id: str):
-    """Get session details."""
-    if session_id not in sessions:
+@app.get("/sessions/{session_id}", responses={200: {"model": Dict[str, Any]}})
+async def get_session(session_id: str, limit: Optional[int] = Query(None, ge=0)):
+    """Get session details, optionally with only the latest ``limit`` messages."""
+    session = await sessions.get(session_id, limit=limit)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return {
+    return ORJSONResponse({
         "session_id": session_id,
-        **sessions[session_id]
-    }
+        **session
+    })
 
 @app.delete("/sessions/{session_id}")
 async def delete_session(session_id: str):
     """Delete a session."""
-    if session_id not in sessions:
+    if not await sessions.delete(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
     
-    del sessions[session_id]
     return {"message": f"Session {session_id} deleted successfully"}
 
 @app.delete("/sessions")
 async def clear_all_sessions():
     """Clear all sessions."""
-    sessions.clear()
+    await sessions.clear()
     return {"message": "All sessions cleared successfully"}
 
-@app.get("/metrics", response_model=MetricsResponse)
+@app.get("/metrics", responses={200: {"model": MetricsResponse}})
 async def get_metrics():
     """Get system metrics for monitoring."""
     try:
@@ -289,95 +521,79 @@ async def get_metrics():
     except Exception:
         agent_metrics = {}
     
-    return MetricsResponse(
-        total_sessions=len(sessions),
-        active_connections=len(manager.active_connections),
-        total_messages=total_messages_processed,
-        uptime_seconds=time.time() - start_time,
-        agent_metrics=agent_metrics
-    )
+    return {
+        "total_sessions": await sessions.count(),
+        "active_connections": len(manager.active_connections),
+        "total_messages": total_messages_processed,
+        "uptime_seconds": time.monotonic() - start_time,
+        "agent_metrics": agent_metrics
+    }
 
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for real-time chat."""
     global total_messages_processed
     
-    await manager.connect(websocket, session_id)
+    use_msgpack = ormsgpack is not None and MSGPACK_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+    await manager.connect(websocket, session_id, subprotocol=MSGPACK_SUBPROTOCOL if use_msgpack else None)
     
     # Initialize session if new
-    if session_id not in sessions:
-        sessions[session_id] = {
-            "conversation_count": 0,
-            "created_at": "2025-08-08T00:00:00Z",
-            "messages": []
-        }
+    await sessions.ensure(session_id)
         
     try:
-        await websocket.send_text(json.dumps({
+        await _send_payload(websocket, {
             "type": "connection",
             "message": f"Connected to session {session_id}",
             "session_id": session_id
-        }))
+        }, use_msgpack)
+        
+        # The typing indicator only varies by session, so encode it once per connection
+        typing_frame = _encode_frame({
+            "type": "typing",
+            "message": "Agent is typing...",
+            "session_id": session_id
+        }, use_msgpack)
         
         while True:
             # Receive message from client
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            message_data = await _receive_payload(websocket, use_msgpack)
             
             if message_data.get("type") == "chat":
                 user_message = message_data.get("message", "")
                 
                 # Send typing indicator
-                await websocket.send_text(json.dumps({
-                    "type": "typing",
-                    "message": "Agent is typing...",
-                    "session_id": session_id
-                }))
+                await websocket.send(typing_frame)
                 
                 try:
                     # Get agent response with streaming
                     app_agent = get_agent()
                     
                     # Use chat_async for streaming
-                    response_chunks = []
-                    async for chunk in app_agent.chat_async(user_message):
-                        chunk_text = str(chunk)
-                        response_chunks.append(chunk_text)
-                        
-                        # Send streaming chunk
-                        await websocket.send_text(json.dumps({
-                            "type": "chunk",
-                            "content": chunk_text,
-                            "session_id": session_id
-                        }))
-                    
-                    # Final complete response
-                    full_response = "".join(response_chunks)
+                    full_response = await _stream_chunks(
+                        websocket, session_id, app_agent.chat_async(user_message), use_msgpack
+                    )
                     
                     # Update session
-                    sessions[session_id]["conversation_count"] += 1
+                    conversation_count = await sessions.append_message(
+                        session_id, user_message, full_response
+                    )
                     total_messages_processed += 1
-                    sessions[session_id]["messages"].append({
-                        "user": user_message,
-                        "agent": full_response,
-                        "timestamp": "2025-08-08T00:00:00Z"
-                    })
                     
                     # Send completion message
-                    await websocket.send_text(json.dumps({
+                    await _send_payload(websocket, {
                         "type": "complete",
                         "message": full_response,
                         "session_id": session_id,
-                        "conversation_count": sessions[session_id]["conversation_count"]
-                    }))
+                        "conversation_count": conversation_count
+                    }, use_msgpack)
                     
                 except Exception as e:
                     logger.error("Error in WebSocket chat", error=str(e))
-                    await websocket.send_text(json.dumps({
+                    await _send_payload(websocket, {
                         "type": "error",
                         "message": f"Error: {str(e)}",
                         "session_id": session_id
-                    }))
+                    }, use_msgpack)
                     
     except WebSocketDisconnect:
         manager.disconnect(websocket, session_id)
@@ -387,14 +603,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
         manager.disconnect(websocket, session_id)
 
 # Multi-agent API endpoints
-try:
-    from ..multiagent import (
-        Orchestrator, WorkflowType, SpecialistPool, create_predefined_pool,
-        WorkflowManager, A2AServerManager
-    )
-    MULTIAGENT_AVAILABLE = True
-except ImportError:
-    MULTIAGENT_AVAILABLE = False
+MULTIAGENT_AVAILABLE = all(
+    importlib.util.find_spec(module) is not None for module in ("strands", "strands_tools")
+)
+if not MULTIAGENT_AVAILABLE:
     logger.warning("Multi-agent features not available - missing dependencies")
 
 # Multi-agent Pydantic models
@@ -428,12 +640,12 @@ if MULTIAGENT_AVAILABLE:
         temperature: float = 0.7
 
 # Global multi-agent instances
-orchestrator: Optional[Orchestrator] = None
-specialist_pool: Optional[SpecialistPool] = None
-workflow_manager: Optional[WorkflowManager] = None
-a2a_manager: Optional[A2AServerManager] = None
+orchestrator: Optional["Orchestrator"] = None
+specialist_pool: Optional["SpecialistPool"] = None
+workflow_manager: Optional["WorkflowManager"] = None
+a2a_manager: Optional["A2AServerManager"] = None
 
-async def get_orchestrator() -> Orchestrator:
+async def get_orchestrator() -> "Orchestrator":
     """Get or create the global orchestrator instance."""
     global orchestrator, specialist_pool, a2a_manager
     
@@ -441,17 +653,24 @@ async def get_orchestrator() -> Orchestrator:
         raise HTTPException(status_code=501, detail="Multi-agent features not available")
     
     if orchestrator is None:
+        from ..multiagent import Orchestrator, create_predefined_pool, A2AServerManager
+        
         # Initialize specialist pool
+        max_concurrency = get_config().bedrock.max_concurrency
         if specialist_pool is None:
             specialist_pool = await create_predefined_pool(get_config())
-            await specialist_pool.initialize_all()
+            await specialist_pool.initialize_all(max_concurrency=max_concurrency)
         
         # Initialize A2A manager
         if a2a_manager is None:
             a2a_manager = A2AServerManager()
         
         # Create orchestrator
-        orchestrator = Orchestrator(a2a_manager=a2a_manager)
+        orchestrator = Orchestrator(
+            a2a_manager=a2a_manager,
+            max_concurrency=max_concurrency,
+            local_routing=get_config().a2a.local_routing
+        )
         
         # Add specialists to orchestrator
         for name, agent in specialist_pool.specialists.items():
@@ -465,7 +684,7 @@ async def get_orchestrator() -> Orchestrator:
     
     return orchestrator
 
-async def get_workflow_manager() -> WorkflowManager:
+async def get_workflow_manager() -> "WorkflowManager":
     """Get or create the global workflow manager instance."""
     global workflow_manager
     
@@ -473,12 +692,21 @@ async def get_workflow_manager() -> WorkflowManager:
         raise HTTPException(status_code=501, detail="Multi-agent features not available")
     
     if workflow_manager is None:
+        from ..multiagent import WorkflowManager
+        
         orch = await get_orchestrator()
         workflow_manager = WorkflowManager(orch, specialist_pool)
         logger.info("Workflow manager initialized")
     
     return workflow_manager
 
+@lru_cache(maxsize=1)
+def _workflow_types() -> Dict[str, Any]:
+    """Map workflow type values to WorkflowType members (built on first use)."""
+    from ..multiagent import WorkflowType
+    
+    return {workflow_type.value: workflow_type for workflow_type in WorkflowType}
+
 # Multi-agent endpoints
 if MULTIAGENT_AVAILABLE:
     
@@ -508,12 +736,14 @@ if MULTIAGENT_AVAILABLE:
     @app.post("/api/v1/multiagent/execute", response_model=MultiAgentResponse)
     async def execute_multiagent_task(request: MultiAgentTask):
         """Execute a task using multi-agent orchestration."""
+        # Parse workflow type before touching the orchestrator
+        workflow_type = _workflow_types().get(request.workflow_type.lower())
+        if workflow_type is None:
+            raise HTTPException(status_code=400, detail=f"Unknown workflow_type: {request.workflow_type}")
+        
         try:
             orch = await get_orchestrator()
             
-            # Parse workflow type
-            workflow_type = WorkflowType(request.workflow_type.lower())
-            
             start_time = time.time()
             result = await orch.execute_workflow(
                 task=request.task,
@@ -0,0 +1,273 @@
+"""
+StrandsFlow API Session Storage
+
+This module keeps chat session state for the API. The in-memory store serves a
+single worker process; the Redis store lets several workers share sessions.
+"""
+
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+
+# Timestamps have one-second resolution, so the formatted string is reused
+# until the second changes instead of being rebuilt for every message
+_cached_second = -1
+_cached_timestamp = ""
+
+
+def _now() -> str:
+    """Current UTC time (to the second) as an ISO 8601 string, e.g. ``2025-08-08T00:00:00Z``."""
+    global _cached_second, _cached_timestamp
+    second = int(time.time())
+    if second != _cached_second:
+        _cached_timestamp = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _cached_second = second
+    return _cached_timestamp
+
+
+class InMemorySessionStore:
+    """
+    Session store backed by a dict in the current process.
+
+    Every method runs without yielding to the event loop, so each operation is
+    atomic with respect to other handlers and needs no locking. At most
+    ``max_sessions`` sessions are kept; the least recently used one is evicted
+    when a new session would exceed the limit. Each session keeps only its
+    latest ``max_messages`` messages.
+
+    Each session's summary dict is updated in place, and the list of all
+    summaries is only rebuilt when sessions are added or removed, so listing
+    sessions returns the cached list without copying it.
+    """
+
+    def __init__(self, max_sessions: Optional[int] = None, max_messages: Optional[int] = None):
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._summaries: Optional[List[Dict[str, Any]]] = None
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+
+    def _ensure(self, session_id: str) -> Dict[str, Any]:
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = {
+                "summary": {
+                    "session_id": session_id,
+                    "conversation_count": 0,
+                    "created_at": _now()
+                },
+                "messages": deque(maxlen=self.max_messages)
+            }
+            if self.max_sessions is not None and len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+            self._summaries = None
+        else:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    async def ensure(self, session_id: str) -> None:
+        """Create the session if it does not exist yet."""
+        self._ensure(session_id)
+
+    async def append_message(self, session_id: str, user: str, agent: str) -> int:
+        """Record one exchange and return the session's conversation count."""
+        session = self._ensure(session_id)
+        summary = session["summary"]
+        summary["conversation_count"] += 1
+        session["messages"].append({"user": user, "agent": agent, "timestamp": _now()})
+        return summary["conversation_count"]
+
+    async def get(self, session_id: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return a session with its (latest ``limit``) messages, or None if it does not exist."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+
+        messages = session["messages"]
+        start = 0 if limit is None else max(0, len(messages) - limit)
+        summary = session["summary"]
+        return {
+            "conversation_count": summary["conversation_count"],
+            "created_at": summary["created_at"],
+            "messages": list(islice(messages, start, None))
+        }
+
+    async def list_sessions(self) -> List[Dict[str, Any]]:
+        """Summaries (id, conversation count, creation time) of all sessions.
+
+        Returns the store's own cached list; callers must not modify it or
+        the summary dicts in it.
+        """
+        if self._summaries is None:
+            self._summaries = [session["summary"] for session in self._sessions.values()]
+        return self._summaries
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session; returns False if it did not exist."""
+        if self._sessions.pop(session_id, None) is None:
+            return False
+        self._summaries = None
+        return True
+
+    async def clear(self) -> None:
+        """Delete all sessions."""
+        self._sessions.clear()
+        self._summaries = None
+
+    async def count(self) -> int:
+        """Number of stored sessions."""
+        return len(self._sessions)
+
+    async def close(self) -> None:
+        """Release store resources."""
+
+
+class RedisSessionStore:
+    """
+    Session store shared across workers through Redis.
+
+    Each session is a hash ``sess:<id>`` holding its metadata plus a list
+    ``sess:<id>:msgs`` of JSON-encoded messages, trimmed to the latest
+    ``max_messages`` entries. With a ``ttl``, both keys expire that many
+    seconds after the session was last used.
+    """
+
+    def __init__(self, client: Any, max_messages: Optional[int] = None, ttl: Optional[int] = None):
+        self._redis = client
+        self.max_messages = max_messages
+        self.ttl = ttl
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        max_messages: Optional[int] = None,
+        ttl: Optional[int] = None,
+        max_connections: Optional[int] = None
+    ) -> "RedisSessionStore":
+        """Create a store with its own connection pool for the given Redis URL."""
+        if aioredis is None:
+            raise ImportError("Redis session storage requires the 'redis' package")
+        client = aioredis.from_url(url, decode_responses=True, max_connections=max_connections)
+        return cls(client, max_messages=max_messages, ttl=ttl)
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"sess:{session_id}"
+
+    async def _session_keys(self) -> List[str]:
+        return [key async for key in self._redis.scan_iter(match="sess:*", _type="HASH")]
+
+    def _touch(self, pipe: Any, key: str) -> None:
+        """Queue expiry refreshes for a session's keys on a pipeline.
+
+        EXPIRE is a no-op for a key that does not exist yet, so a session
+        without messages only expires its hash; ``append_message`` creates the
+        message list and refreshes both keys in the same transaction.
+        """
+        if self.ttl is not None:
+            pipe.expire(key, self.ttl)
+            pipe.expire(f"{key}:msgs", self.ttl)
+
+    async def ensure(self, session_id: str) -> None:
+        """Create the session if it does not exist yet."""
+        key = self._key(session_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, "created_at", _now())
+            pipe.hsetnx(key, "conversation_count", 0)
+            self._touch(pipe, key)
+            await pipe.execute()
+
+    async def append_message(self, session_id: str, user: str, agent: str) -> int:
+        """Record one exchange and return the session's conversation count."""
+        key = self._key(session_id)
+        entry = orjson.dumps({"user": user, "agent": agent, "timestamp": _now()})
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hsetnx(key, "created_at", _now())
+            pipe.hincrby(key, "conversation_count", 1)
+            pipe.rpush(f"{key}:msgs", entry)
+            if self.max_messages is not None:
+                pipe.ltrim(f"{key}:msgs", -self.max_messages, -1)
+            self._touch(pipe, key)
+            results = await pipe.execute()
+        return results[1]
+
+    async def get(self, session_id: str, limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Return a session with its (latest ``limit``) messages, or None if it does not exist."""
+        key = self._key(session_id)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(key)
+            if limit is None:
+                pipe.lrange(f"{key}:msgs", 0, -1)
+            elif limit > 0:
+                pipe.lrange(f"{key}:msgs", -limit, -1)
+            data, *rest = await pipe.execute()
+        messages = rest[0] if rest else []
+
+        if not data:
+            return None
+        return {
+            "conversation_count": int(data.get("conversation_count", 0)),
+            "created_at": data.get("created_at"),
+            "messages": [orjson.loads(message) for message in messages]
+        }
+
+    async def list_sessions(self) -> List[Dict[str, Any]]:
+        """Summaries (id, conversation count, creation time) of all sessions."""
+        keys = await self._session_keys()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.hmget(key, "conversation_count", "created_at")
+            rows = await pipe.execute()
+
+        return [
+            {
+                "session_id": key[len("sess:"):],
+                "conversation_count": int(count or 0),
+                "created_at": created_at
+            }
+            for key, (count, created_at) in zip(keys, rows)
+        ]
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session; returns False if it did not exist."""
+        key = self._key(session_id)
+        return await self._redis.delete(key, f"{key}:msgs") > 0
+
+    async def clear(self) -> None:
+        """Delete all sessions."""
+        keys = await self._session_keys()
+        if keys:
+            await self._redis.delete(*keys, *(f"{key}:msgs" for key in keys))
+
+    async def count(self) -> int:
+        """Number of stored sessions."""
+        return len(await self._session_keys())
+
+    async def close(self) -> None:
+        """Release store resources."""
+        await self._redis.aclose()
+
+
+def create_session_store(
+    redis_url: Optional[str] = None,
+    max_sessions: Optional[int] = None,
+    max_messages: Optional[int] = None,
+    ttl: Optional[int] = None,
+    max_connections: Optional[int] = None
+):
+    """Create a Redis store when a URL is configured, else an in-memory one."""
+    if redis_url:
+        return RedisSessionStore.from_url(
+            redis_url, max_messages=max_messages, ttl=ttl, max_connections=max_connections
+        )
+    return InMemorySessionStore(max_sessions=max_sessions, max_messages=max_messages)
@@ -6,7 +6,7 @@ Command-line interface for the StrandsFlow AI agent platform.
 Provides tools for agent creation, configuration, and interaction.
 """
 
-import asyncio
+import os
 import sys
 import json
 import time
@@ -15,14 +15,13 @@ from typing import Optional, List, Dict, Any
 
 import typer
 from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.table import Table
 from rich import print as rprint
 
-from .core.config import StrandsFlowConfig
-from .core.agent import StrandsFlowAgent
-from .multiagent.orchestrator import Orchestrator
-from .multiagent.a2a_server import A2AServer, A2AClient
+from .core.eventloop import run
+
+# Heavier modules (the agent stack, configuration, YAML, rich tables and
+# prompts) are imported inside the commands that use them, so that commands
+# like `--help` and `version` start quickly
 
 app = typer.Typer(
     name="strandsflow",
@@ -38,10 +37,131 @@ multiagent_app = typer.Typer(
 )
 app.add_typer(multiagent_app, name="multiagent")
 
+
+def _sniff_subcommand(position: int) -> Optional[str]:
+    """
+    Return the subcommand named at ``sys.argv[position]``.
+    
+    Returns None (meaning every command may be needed) for help and option
+    arguments, shell completion, or when this module is not running as the
+    ``strandsflow`` CLI itself (e.g. when imported by tests).
+    """
+    if Path(sys.argv[0]).stem not in ("strandsflow", "cli"):
+        return None
+    if "_STRANDSFLOW_COMPLETE" in os.environ or len(sys.argv) <= position:
+        return None
+    arg = sys.argv[position]
+    return None if arg.startswith("-") else arg
+
+
+# Only the invoked command is registered, so Typer doesn't build Click
+# commands (and inspect signatures) for the others on every run
+_SUBCOMMAND = _sniff_subcommand(1)
+_MULTIAGENT_SUBCOMMAND = _sniff_subcommand(2) if _SUBCOMMAND == "multiagent" else None
+
+
+def _command(name: str):
+    """Register a top-level command unless a different one was invoked."""
+    if _SUBCOMMAND in (None, name):
+        return app.command(name)
+    return lambda func: func
+
+
+def _multiagent_command(name: str):
+    """Register a `multiagent` subcommand unless a different command was invoked."""
+    if _SUBCOMMAND is None or (
+        _SUBCOMMAND == "multiagent" and _MULTIAGENT_SUBCOMMAND in (None, name)
+    ):
+        return multiagent_app.command(name)
+    return lambda func: func
+
+# Written by `multiagent create`; lists the agents generated in a workspace
+MANIFEST_FILE = "manifest.json"
+
+
+def _workspace_agent_types(workspace_path: Path) -> List[str]:
+    """List agent types in a workspace, preferring its manifest over a directory scan."""
+    try:
+        with open(workspace_path / MANIFEST_FILE) as f:
+            return [agent["type"] for agent in json.load(f)["agents"]]
+    except (FileNotFoundError, KeyError, ValueError):
+        pass
+    
+    return [
+        config_file.stem[:-len("_config")]
+        for config_file in workspace_path.glob("*_config.yaml")
+        if config_file.stem != "orchestrator_config"
+    ]
+
+
+def _config_cache_path(path: Path) -> Path:
+    """Return the sidecar cache file for a configuration file.
+    
+    Sidecars live in the user cache directory (``$XDG_CACHE_HOME`` or
+    ``~/.cache``), named by a hash of the configuration file's absolute path,
+    so nothing is written next to the user's files.
+    """
+    import hashlib
+    
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    digest = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+    return Path(cache_home) / "strandsflow" / "config" / f"{digest}.json"
+
+
+def _load_config(config_path: str):
+    """
+    Load a configuration file, caching parsed YAML in a JSON sidecar.
+    
+    The sidecar (see ``_config_cache_path``) is reused while the YAML file's
+    path, mtime, size and inode and the StrandsFlow version match, so repeated
+    CLI runs skip YAML parsing.
+    """
+    from . import __version__
+    from .core.config import StrandsFlowConfig
+    
+    path = Path(config_path)
+    if path.suffix.lower() not in (".yml", ".yaml"):
+        return StrandsFlowConfig.from_file(config_path)
+    
+    stat = path.stat()
+    key = {
+        "version": __version__,
+        "path": str(path.resolve()),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "ino": stat.st_ino
+    }
+    cache_path = _config_cache_path(path)
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            return StrandsFlowConfig(**cached["data"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    from .core.yaml_cache import load_yaml
+    
+    config = StrandsFlowConfig.from_file(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "data": load_yaml(config_path)}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache directory or YAML values JSON cannot represent: skip caching
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return config
+
+
 console = Console()
 
 
-@app.command()
+@_command("init")
 def init(
     config_path: str = typer.Option(
         "strandsflow.yaml",
@@ -57,6 +177,7 @@ def init(
     )
 ):
     """Initialize a new StrandsFlow configuration."""
+    from .core.config import StrandsFlowConfig
     
     config_file = Path(config_path)
     
@@ -70,16 +191,18 @@ def init(
     
     try:
         config.save_to_file(config_path)
-        rprint(f"[green]✅ Configuration created: {config_path}[/green]")
-        rprint(f"[blue]📝 Agent name: {config.agent.name}[/blue]")
-        rprint(f"[blue]🤖 Model: {config.bedrock.model_id}[/blue]")
-        rprint(f"[blue]🌍 Region: {config.bedrock.region_name}[/blue]")
+        rprint(
+            f"[green]✅ Configuration created: {config_path}[/green]\n"
+            f"[blue]📝 Agent name: {config.agent.name}[/blue]\n"
+            f"[blue]🤖 Model: {config.bedrock.model_id}[/blue]\n"
+            f"[blue]🌍 Region: {config.bedrock.region_name}[/blue]"
+        )
     except Exception as e:
         rprint(f"[red]❌ Failed to create configuration: {e}[/red]")
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("chat")
 def chat(
     config_path: str = typer.Option(
         "strandsflow.yaml",
@@ -95,23 +218,30 @@ def chat(
     )
 ):
     """Start an interactive chat session with the agent."""
+    from rich.prompt import Prompt
+    
+    from .core.agent import StrandsFlowAgent
+    from .core.config import StrandsFlowConfig
     
     async def run_chat():
         try:
             # Load configuration
-            if Path(config_path).exists():
-                config = StrandsFlowConfig.from_file(config_path)
+            try:
+                config = _load_config(config_path)
                 rprint(f"[green]📁 Loaded config from: {config_path}[/green]")
-            else:
+            except FileNotFoundError:
                 config = StrandsFlowConfig()
                 rprint("[yellow]⚠️ Using default configuration[/yellow]")
             
-            # Create agent
+            # Create agent; it is reused for every turn so its Bedrock client
+            # keeps its pooled keep-alive connections between messages
             agent = StrandsFlowAgent(config=config)
             await agent.initialize()
             
-            rprint(f"[blue]🤖 {config.agent.name} is ready![/blue]")
-            rprint(f"[dim]Model: {config.bedrock.model_id}[/dim]")
+            rprint(
+                f"[blue]🤖 {config.agent.name} is ready![/blue]\n"
+                f"[dim]Model: {config.bedrock.model_id}[/dim]"
+            )
             
             if message:
                 # Single message mode
@@ -149,10 +279,10 @@ def chat(
             rprint(f"[red]❌ Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(run_chat())
+    run(run_chat())
 
 
-@app.command()
+@_command("config")
 def config(
     config_path: str = typer.Option(
         "strandsflow.yaml",
@@ -168,13 +298,16 @@ def config(
     )
 ):
     """Manage StrandsFlow configuration."""
+    from rich.table import Table
+    
+    from .core.config import StrandsFlowConfig
     
     if show:
         try:
-            if Path(config_path).exists():
-                config = StrandsFlowConfig.from_file(config_path)
+            try:
+                config = _load_config(config_path)
                 rprint(f"[green]📁 Configuration from: {config_path}[/green]")
-            else:
+            except FileNotFoundError:
                 config = StrandsFlowConfig()
                 rprint("[yellow]⚠️ Default configuration (no file found)[/yellow]")
             
@@ -183,15 +316,19 @@ def config(
             table.add_column("Setting", style="cyan")
             table.add_column("Value", style="magenta")
             
-            table.add_row("Agent Name", config.agent.name)
-            table.add_row("Agent Description", config.agent.description[:50] + "...")
-            table.add_row("Model ID", config.bedrock.model_id)
-            table.add_row("Region", config.bedrock.region_name)
-            table.add_row("Temperature", str(config.bedrock.temperature))
-            table.add_row("Max Tokens", str(config.bedrock.max_tokens))
-            table.add_row("Streaming", str(config.bedrock.streaming))
-            table.add_row("API Host", config.api.host)
-            table.add_row("API Port", str(config.api.port))
+            rows = [
+                ("Agent Name", config.agent.name),
+                ("Agent Description", config.agent.description[:50] + "..."),
+                ("Model ID", config.bedrock.model_id),
+                ("Region", config.bedrock.region_name),
+                ("Temperature", str(config.bedrock.temperature)),
+                ("Max Tokens", str(config.bedrock.max_tokens)),
+                ("Streaming", str(config.bedrock.streaming)),
+                ("API Host", config.api.host),
+                ("API Port", str(config.api.port))
+            ]
+            for setting, value in rows:
+                table.add_row(setting, value)
             
             console.print(table)
             
@@ -202,7 +339,7 @@ def config(
         rprint("[yellow]Use --show to display configuration[/yellow]")
 
 
-@app.command()
+@_command("server")
 def server(
     config_path: str = typer.Option(
         "strandsflow.yaml",
@@ -230,13 +367,14 @@ def server(
     )
 ):
     """Start the StrandsFlow API server."""
+    from .core.config import StrandsFlowConfig
     
     try:
         # Load configuration
-        if Path(config_path).exists():
-            config = StrandsFlowConfig.from_file(config_path)
+        try:
+            config = _load_config(config_path)
             rprint(f"[green]📁 Loaded config from: {config_path}[/green]")
-        else:
+        except FileNotFoundError:
             config = StrandsFlowConfig()
             rprint("[yellow]⚠️ Using default configuration[/yellow]")
         
@@ -248,69 +386,83 @@ def server(
         if reload:
             config.api.reload = reload
         
-        rprint(f"[blue]🚀 Starting StrandsFlow API server[/blue]")
-        rprint(f"[dim]Host: {config.api.host}[/dim]")
-        rprint(f"[dim]Port: {config.api.port}[/dim]")
-        rprint(f"[dim]Reload: {config.api.reload}[/dim]")
+        rprint(
+            "[blue]🚀 Starting StrandsFlow API server[/blue]\n"
+            f"[dim]Host: {config.api.host}[/dim]\n"
+            f"[dim]Port: {config.api.port}[/dim]\n"
+            f"[dim]Reload: {config.api.reload}[/dim]"
+        )
         
-        # Import and start the API server
+        # Import and start the API server; httptools is used when installed,
+        # falling back to h11 otherwise
         import uvicorn
-        uvicorn.run(
-            "strandsflow.api.app:app",
-            host=config.api.host,
-            port=config.api.port,
-            reload=config.api.reload,
-            log_level="info"
-        )
+        if config.api.reload:
+            # The reloader runs the app in a subprocess that sets up its own loop
+            uvicorn.run(
+                "strandsflow.api.app:app",
+                host=config.api.host,
+                port=config.api.port,
+                reload=True,
+                loop="auto",
+                http="auto",
+                log_level="info"
+            )
+        else:
+            # Serve on the CLI's event loop (uvloop, or winloop on Windows)
+            server = uvicorn.Server(uvicorn.Config(
+                "strandsflow.api.app:app",
+                host=config.api.host,
+                port=config.api.port,
+                loop="none",
+                http="auto",
+                log_level="info"
+            ))
+            run(server.serve())
         
     except Exception as e:
         rprint(f"[red]❌ Error starting server: {e}[/red]")
         raise typer.Exit(1)
 
 
-@app.command()
+@_command("version")
 def version():
     """Show StrandsFlow version information."""
-    from . import __version__
+    from importlib.metadata import PackageNotFoundError, version as package_version
     
-    table = Table(title="StrandsFlow Version Information")
-    table.add_column("Component", style="cyan")
-    table.add_column("Version", style="magenta")
+    from rich.table import Table
     
-    table.add_row("StrandsFlow", __version__)
+    from . import __version__
     
+    rows = [("StrandsFlow", __version__)]
+    
+    # Read versions from installed package metadata rather than importing
+    # strands and boto3, which would load the whole SDK and botocore
     try:
-        import strands
-        table.add_row("Strands SDK", strands.__version__)
-    except:
-        table.add_row("Strands SDK", "Unknown")
+        rows.append(("Strands SDK", package_version("strands-agents")))
+    except PackageNotFoundError:
+        rows.append(("Strands SDK", "Unknown"))
     
     try:
-        import boto3
-        table.add_row("boto3", boto3.__version__)
-    except:
-        table.add_row("boto3", "Not installed")
+        rows.append(("boto3", package_version("boto3")))
+    except PackageNotFoundError:
+        rows.append(("boto3", "Not installed"))
+    
+    table = Table(title="StrandsFlow Version Information")
+    table.add_column("Component", style="cyan")
+    table.add_column("Version", style="magenta")
+    for component, component_version in rows:
+        table.add_row(component, component_version)
     
     console.print(table)
 
 
-@app.command()
-def create(
-    agent_type: str = typer.Argument(..., help="Type of agent to create (data-analysis, code-review, custom)"),
-    name: str = typer.Option("My Custom Agent", "--name", "-n", help="Agent name"),
-    config_file: str = typer.Option("custom_agent_config.yaml", "--config", "-c", help="Config file path"),
-    model: str = typer.Option("anthropic.claude-3-haiku-20240307-v1:0", "--model", "-m", help="Bedrock model ID"),
-    port: int = typer.Option(8001, "--port", "-p", help="API server port"),
-):
-    """Create a new custom agent configuration."""
-    
-    try:
-        # Predefined agent templates
-        agent_templates = {
-            "data-analysis": {
-                "name": f"{name} - Data Analysis Expert",
-                "description": "Specialized AI agent for data analysis, statistics, and business intelligence",
-                "system_prompt": """You are a data analysis expert with deep knowledge of:
+# Templates for ``strandsflow create``; "{name}" in each name is filled in
+# with the --name option
+_AGENT_TEMPLATES = {
+    "data-analysis": {
+        "name": "{name} - Data Analysis Expert",
+        "description": "Specialized AI agent for data analysis, statistics, and business intelligence",
+        "system_prompt": """You are a data analysis expert with deep knowledge of:
 - Statistical analysis and hypothesis testing
 - Data visualization and reporting
 - Business intelligence and KPI tracking
@@ -318,13 +470,13 @@ def create(
 - Database querying and data processing
 
 Always provide step-by-step analysis, show your reasoning, and suggest actionable insights.""",
-                "max_tokens": 8192,
-                "temperature": 0.3
-            },
-            "code-review": {
-                "name": f"{name} - Code Review Specialist",
-                "description": "Expert code reviewer focusing on quality, security, and best practices",
-                "system_prompt": """You are a senior software engineer and code review expert specializing in:
+        "max_tokens": 8192,
+        "temperature": 0.3
+    },
+    "code-review": {
+        "name": "{name} - Code Review Specialist",
+        "description": "Expert code reviewer focusing on quality, security, and best practices",
+        "system_prompt": """You are a senior software engineer and code review expert specializing in:
 - Code quality assessment and improvement
 - Security vulnerability detection
 - Performance optimization
@@ -332,13 +484,13 @@ Always provide step-by-step analysis, show your reasoning, and suggest actionabl
 - Documentation and maintainability
 
 Provide detailed, constructive feedback with specific examples and suggestions.""",
-                "max_tokens": 6144,
-                "temperature": 0.2
-            },
-            "customer-support": {
-                "name": f"{name} - Customer Support Assistant",
-                "description": "Friendly and helpful customer support agent",
-                "system_prompt": """You are a helpful and empathetic customer support representative with expertise in:
+        "max_tokens": 6144,
+        "temperature": 0.2
+    },
+    "customer-support": {
+        "name": "{name} - Customer Support Assistant",
+        "description": "Friendly and helpful customer support agent",
+        "system_prompt": """You are a helpful and empathetic customer support representative with expertise in:
 - Troubleshooting technical issues
 - Product knowledge and feature explanations
 - Order management and billing inquiries
@@ -346,13 +498,13 @@ Provide detailed, constructive feedback with specific examples and suggestions."
 - Customer satisfaction
 
 Always be polite, patient, and solution-oriented. Ask clarifying questions when needed.""",
-                "max_tokens": 4096,
-                "temperature": 0.7
-            },
-            "creative-writing": {
-                "name": f"{name} - Creative Writing Assistant",
-                "description": "Creative writing companion for stories, content, and ideas",
-                "system_prompt": """You are a creative writing expert and storytelling companion skilled in:
+        "max_tokens": 4096,
+        "temperature": 0.7
+    },
+    "creative-writing": {
+        "name": "{name} - Creative Writing Assistant",
+        "description": "Creative writing companion for stories, content, and ideas",
+        "system_prompt": """You are a creative writing expert and storytelling companion skilled in:
 - Creative fiction and narrative development
 - Content creation and copywriting
 - Character development and dialogue
@@ -360,29 +512,41 @@ Always be polite, patient, and solution-oriented. Ask clarifying questions when
 - Style adaptation and voice consistency
 
 Help users develop compelling narratives and engaging content.""",
-                "max_tokens": 6144,
-                "temperature": 0.8
-            },
-            "custom": {
-                "name": name,
-                "description": "Custom AI agent with flexible configuration",
-                "system_prompt": "You are a helpful AI assistant. Customize this prompt for your specific use case.",
-                "max_tokens": 4096,
-                "temperature": 0.7
-            }
-        }
-        
-        if agent_type not in agent_templates:
+        "max_tokens": 6144,
+        "temperature": 0.8
+    },
+    "custom": {
+        "name": "{name}",
+        "description": "Custom AI agent with flexible configuration",
+        "system_prompt": "You are a helpful AI assistant. Customize this prompt for your specific use case.",
+        "max_tokens": 4096,
+        "temperature": 0.7
+    }
+}
+
+
+@_command("create")
+def create(
+    agent_type: str = typer.Argument(..., help="Type of agent to create (data-analysis, code-review, custom)"),
+    name: str = typer.Option("My Custom Agent", "--name", "-n", help="Agent name"),
+    config_file: str = typer.Option("custom_agent_config.yaml", "--config", "-c", help="Config file path"),
+    model: str = typer.Option("anthropic.claude-3-haiku-20240307-v1:0", "--model", "-m", help="Bedrock model ID"),
+    port: int = typer.Option(8001, "--port", "-p", help="API server port"),
+):
+    """Create a new custom agent configuration."""
+    try:
+        if agent_type not in _AGENT_TEMPLATES:
             rprint(f"[red]Error: Unknown agent type '{agent_type}'[/red]")
-            rprint(f"[yellow]Available types: {', '.join(agent_templates.keys())}[/yellow]")
+            rprint(f"[yellow]Available types: {', '.join(_AGENT_TEMPLATES)}[/yellow]")
             raise typer.Exit(1)
         
-        template = agent_templates[agent_type]
+        template = _AGENT_TEMPLATES[agent_type]
+        agent_name = template["name"].format(name=name)
         
         # Create configuration
         config_data = {
             "agent": {
-                "name": template["name"],
+                "name": agent_name,
                 "description": template["description"],
                 "enable_memory": True,
                 "max_conversation_turns": 50,
@@ -430,20 +594,24 @@ Help users develop compelling narratives and engaging content.""",
         }
         
         # Write configuration file
-        import yaml
-        with open(config_file, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, indent=2)
-        
-        rprint(f"[green]✅ Created custom agent configuration: {config_file}[/green]")
-        rprint(f"[blue]Agent Type: {agent_type}[/blue]")
-        rprint(f"[blue]Agent Name: {template['name']}[/blue]")
-        rprint(f"[blue]Port: {port}[/blue]")
-        rprint(f"[blue]Model: {model}[/blue]")
+        from .core.yaml_cache import dump_yaml
         
-        rprint("\n[yellow]Next steps:[/yellow]")
-        rprint(f"1. [cyan]strandsflow server --config {config_file}[/cyan]")
-        rprint(f"2. [cyan]strandsflow chat --config {config_file}[/cyan]")
-        rprint(f"3. Visit [cyan]http://localhost:{port}/docs[/cyan] for API documentation")
+        with open(config_file, 'w') as f:
+            dump_yaml(config_data, f, indent=2)
+        
+        lines = [
+            f"[green]✅ Created custom agent configuration: {config_file}[/green]",
+            f"[blue]Agent Type: {agent_type}[/blue]",
+            f"[blue]Agent Name: {agent_name}[/blue]",
+            f"[blue]Port: {port}[/blue]",
+            f"[blue]Model: {model}[/blue]",
+            "",
+            "[yellow]Next steps:[/yellow]",
+            f"1. [cyan]strandsflow server --config {config_file}[/cyan]",
+            f"2. [cyan]strandsflow chat --config {config_file}[/cyan]",
+            f"3. Visit [cyan]http://localhost:{port}/docs[/cyan] for API documentation"
+        ]
+        rprint("\n".join(lines))
         
         # Create example usage script
         example_script = f"""#!/usr/bin/env python3
@@ -451,9 +619,10 @@ Help users develop compelling narratives and engaging content.""",
 Example usage of your custom {agent_type} agent.
 \"\"\"
 
-import asyncio
 import httpx
 
+from strandsflow.core.eventloop import run
+
 async def test_custom_agent():
     \"\"\"Test the custom agent via API.\"\"\"
     
@@ -481,7 +650,7 @@ async def test_custom_agent():
 
 if __name__ == "__main__":
     print("Testing custom {agent_type} agent...")
-    asyncio.run(test_custom_agent())
+    run(test_custom_agent())
 """
         
         script_file = f"test_{agent_type.replace('-', '_')}_agent.py"
@@ -495,7 +664,7 @@ if __name__ == "__main__":
         raise typer.Exit(1)
 
 
-@multiagent_app.command("create")
+@_multiagent_command("create")
 def create_multiagent_setup(
     agents: str = typer.Option(
         "assistant,researcher",
@@ -523,6 +692,9 @@ def create_multiagent_setup(
     )
 ):
     """Create multiple agents configured for A2A communication."""
+    from rich.table import Table
+    
+    from .core.yaml_cache import dump_yaml
     
     try:
         # Parse agents list
@@ -669,11 +841,6 @@ Write clean, efficient, well-documented code with proper error handling.""",
                 }
             }
             
-            # Write configuration
-            import yaml
-            with open(config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
-            
             created_agents.append({
                 "type": agent_type,
                 "config_file": str(config_file),
@@ -683,14 +850,11 @@ Write clean, efficient, well-documented code with proper error handling.""",
             })
             
             agent_configs[agent_type] = config_data
-            
-            rprint(f"[green]✅ Created {agent_type} agent: {config_file}[/green]")
         
-        # Update all configs with peer information
+        # Add peer information and write each configuration once
         for agent in created_agents:
             config_file = Path(agent["config_file"])
-            with open(config_file, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = agent_configs[agent["type"]]
             
             # Add peer information
             peers = []
@@ -704,7 +868,9 @@ Write clean, efficient, well-documented code with proper error handling.""",
             config_data["a2a"]["peers"] = peers
             
             with open(config_file, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+                dump_yaml(config_data, f, indent=2)
+            
+            rprint(f"[green]✅ Created {agent['type']} agent: {config_file}[/green]")
         
         # Create orchestrator configuration
         orchestrator_config = workspace_path / "orchestrator_config.yaml"
@@ -726,7 +892,11 @@ Write clean, efficient, well-documented code with proper error handling.""",
         }
         
         with open(orchestrator_config, 'w') as f:
-            yaml.dump(orchestrator_data, f, default_flow_style=False, indent=2)
+            dump_yaml(orchestrator_data, f, indent=2)
+        
+        # Record the generated agents so later commands don't have to glob
+        with open(workspace_path / MANIFEST_FILE, 'w') as f:
+            json.dump({"agents": created_agents}, f, indent=2)
         
         # Create startup script
         startup_script = workspace_path / "start_agents.py"
@@ -737,16 +907,67 @@ Starts all agents and enables A2A communication.
 """
 
 import asyncio
-import subprocess
-import time
+import httpx
+import multiprocessing
 import sys
 from pathlib import Path
 
+import uvicorn
+
+# Import the API stack once in the parent; on Linux, forked agent processes
+# inherit the loaded modules instead of booting a fresh interpreter each. The
+# agent module is imported explicitly because the API app only loads it on
+# first use. The parent creates no AWS clients, so none are shared by forks.
+import strandsflow.api.app as api
+import strandsflow.core.agent  # noqa: F401
+from strandsflow.core.config import StrandsFlowConfig
+from strandsflow.core.eventloop import run
+
+# Fork is unsafe with macOS system frameworks, so other platforms use spawn
+_MP = multiprocessing.get_context("fork" if sys.platform == "linux" else "spawn")
+
+def serve_agent(config_file):
+    """Run one agent's API server with its own configuration."""
+    config = StrandsFlowConfig.from_file(config_file)
+    api.config = config
+    uvicorn.run(api.app, host=config.api.host, port=config.api.port, log_level="info")
+
 def start_agent_server(config_file, agent_type):
     """Start an agent server in the background."""
-    cmd = [sys.executable, "-m", "strandsflow", "server", "--config", config_file]
     print(f"Starting {{agent_type}} agent: {{config_file}}")
-    return subprocess.Popen(cmd)
+    process = _MP.Process(target=serve_agent, args=(config_file,), name=f"{{agent_type}}_agent")
+    process.start()
+    return process
+
+READY_TIMEOUT = 60.0
+
+async def wait_ready(client, port, process, timeout=READY_TIMEOUT):
+    """Poll an agent's health endpoint until it responds.
+    
+    Fails as soon as the agent process exits, or after ``timeout`` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while process.is_alive():
+        try:
+            response = await client.get(f"http://localhost:{{port}}/health")
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if loop.time() >= deadline:
+            raise TimeoutError(f"{{process.name}} not ready on port {{port}} after {{timeout:.0f}}s")
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"{{process.name}} exited with code {{process.exitcode}} before becoming ready")
+
+async def wait_all_ready(client, servers):
+    """Wait for every ``(port, process)`` server, stopping at the first failure."""
+    tasks = [asyncio.ensure_future(wait_ready(client, port, process)) for port, process in servers]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 async def main():
     """Start all agents and wait."""
@@ -754,20 +975,27 @@ async def main():
     workspace = Path("{workspace}")
     processes = []
     
-    agents = {json.dumps(agent_list)}
+    agents = {json.dumps(created_agents)}
     
     try:
-        # Start all agent servers
-        for agent_type in agents:
-            config_file = workspace / f"{{agent_type}}_config.yaml"
+        # Start all agent servers at once
+        started = []
+        for agent in agents:
+            config_file = workspace / f"{{agent['type']}}_config.yaml"
             if config_file.exists():
-                process = start_agent_server(str(config_file), agent_type)
-                processes.append(process)
-                time.sleep(2)  # Stagger startup
+                processes.append(start_agent_server(str(config_file), agent['type']))
+                started.append(agent)
+        
+        # Wait until every server answers its health check
+        async with httpx.AsyncClient(timeout=1.0) as client:
+            await wait_all_ready(
+                client, [(agent['api_port'], process) for agent, process in zip(started, processes)]
+            )
         
         print(f"\\n🚀 Started {{len(processes)}} agents!")
         print("\\nAgent endpoints:")
-        {chr(10).join([f'        print("  {agent["type"].title()}: http://localhost:{agent["api_port"]}")' for agent in created_agents])}
+        for agent in started:
+            print(f"  {{agent['type'].title()}}: http://localhost:{{agent['api_port']}}")
         
         print("\\nPress Ctrl+C to stop all agents...")
         
@@ -775,19 +1003,23 @@ async def main():
         while True:
             await asyncio.sleep(1)
             
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # run() delivers Ctrl+C to the main task as a cancellation
         print("\\n🛑 Stopping all agents...")
+    except (RuntimeError, TimeoutError) as e:
+        print(f"\\n❌ {{e}}")
+        print("🛑 Stopping all agents...")
+    finally:
         for process in processes:
             process.terminate()
         
-        # Wait for clean shutdown
-        for process in processes:
-            process.wait()
+        # Wait for clean shutdown of all agents in parallel
+        await asyncio.gather(*(asyncio.to_thread(process.join) for process in processes))
         
         print("✅ All agents stopped.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 '''
         
         with open(startup_script, 'w') as f:
@@ -804,24 +1036,81 @@ Test A2A Communication Between Agents
 import asyncio
 import httpx
 import json
+import orjson
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_delay, wait_exponential
 from pathlib import Path
+from typing import NamedTuple
+
+from strandsflow.core.eventloop import run
+
+class AgentEndpoint(NamedTuple):
+    """Connection details for one agent, with its URLs formatted once."""
+    type: str
+    title: str
+    api_port: int
+    a2a_port: int
+    agent_id: str
+    health_url: str
+    chat_url: str
+    orchestrate_url: str
+
+def _endpoint(agent):
+    base_url = f"http://localhost:{{agent['api_port']}}"
+    return AgentEndpoint(
+        agent["type"], agent["type"].title(), agent["api_port"], agent["a2a_port"], agent["agent_id"],
+        f"{{base_url}}/health", f"{{base_url}}/chat", f"{{base_url}}/multiagent/orchestrate"
+    )
+
+_JSON_HEADERS = {{"content-type": "application/json"}}
+
+AGENTS = tuple(_endpoint(agent) for agent in {json.dumps(created_agents)})
+
+# One pooled client for the whole run so the orchestration request reuses the
+# keep-alive connection opened by the health checks.
+_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60),
+    timeout=httpx.Timeout(5.0),
+)
+
+async def probe_health(agent):
+    """GET an agent's health endpoint, retrying briefly while it is still starting."""
+    async for attempt in AsyncRetrying(
+        stop=stop_after_delay(5),
+        wait=wait_exponential(multiplier=0.05, max=0.5),
+        retry=retry_if_exception_type(httpx.ConnectError),
+        reraise=True
+    ):
+        with attempt:
+            return await _CLIENT.get(agent.health_url)
+
+async def read_preview(response, limit=100):
+    """Read a response body and return its ``response`` text shortened for display."""
+    body = await response.aread()
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        text = body.decode("utf-8", errors="replace")
+    else:
+        text = str(data.get('response', 'No response')) if isinstance(data, dict) else str(data)
+    return text if len(text) <= limit else f"{{text[:limit]}}..."
 
 async def test_a2a_communication():
     """Test agent-to-agent communication."""
     
-    agents = {json.dumps(created_agents)}
-    
     print("🧪 Testing A2A Communication...")
     
-    async with httpx.AsyncClient() as client:
-        # Test each agent's health
-        for agent in agents:
-            try:
-                response = await client.get(f"http://localhost:{{agent['api_port']}}/health")
+    try:
+        # Test each agent's health concurrently
+        results = await asyncio.gather(
+            *[probe_health(agent) for agent in AGENTS],
+            return_exceptions=True
+        )
+        for agent, response in zip(AGENTS, results):
+            if isinstance(response, Exception):
+                print(f"❌ {{agent.title}} Agent: {{response}}")
+            else:
                 status = "✅" if response.status_code == 200 else "❌"
-                print(f"{{status}} {{agent['type'].title()}} Agent (port {{agent['api_port']}})")
-            except Exception as e:
-                print(f"❌ {{agent['type'].title()}} Agent: {{e}}")
+                print(f"{{status}} {{agent.title}} Agent (port {{agent.api_port}})")
         
         # Test orchestrated communication
         print("\\n🤝 Testing orchestrated communication...")
@@ -830,27 +1119,30 @@ async def test_a2a_communication():
             # Example: Get researcher to help assistant
             message = "I need research on the latest AI trends in 2024. Can you help?"
             
-            response = await client.post(
-                f"http://localhost:{created_agents[0]['api_port']}/multiagent/orchestrate",
-                json={{
+            async with _CLIENT.stream(
+                "POST",
+                AGENTS[0].orchestrate_url,
+                content=orjson.dumps({{
                     "task": message,
                     "required_agents": ["researcher"],
                     "session_id": "test-session"
-                }}
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                print("✅ Orchestrated communication successful!")
-                print(f"Response: {{result.get('response', 'No response')[:100]}}...")
-            else:
-                print(f"❌ Orchestration failed: {{response.status_code}}")
+                }}),
+                headers=_JSON_HEADERS
+            ) as response:
+                if response.status_code == 200:
+                    preview = await read_preview(response)
+                    print("✅ Orchestrated communication successful!")
+                    print(f"Response: {{preview}}")
+                else:
+                    print(f"❌ Orchestration failed: {{response.status_code}}")
                 
         except Exception as e:
             print(f"❌ Orchestration error: {{e}}")
+    finally:
+        await _CLIENT.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(test_a2a_communication())
+    run(test_a2a_communication())
 '''
         
         with open(test_script, 'w') as f:
@@ -864,73 +1156,112 @@ if __name__ == "__main__":
 Interactive Agent-to-Agent Chat Interface
 """
 
-import asyncio
 import httpx
 import json
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
+import orjson
+from typing import NamedTuple
+from prompt_toolkit import PromptSession
 
-console = Console()
+from strandsflow.core.eventloop import run
+
+# rich is imported on first use so importing this module stays cheap
+console = None
+Panel = None
+
+def _load_rich():
+    """Import rich and create the console."""
+    global console, Panel
+    from rich.console import Console
+    from rich.panel import Panel
+    console = Console()
+
+class AgentEndpoint(NamedTuple):
+    """Connection details for one agent, with its URLs formatted once."""
+    type: str
+    title: str
+    api_port: int
+    a2a_port: int
+    agent_id: str
+    health_url: str
+    chat_url: str
+    orchestrate_url: str
+
+def _endpoint(agent):
+    base_url = f"http://localhost:{{agent['api_port']}}"
+    return AgentEndpoint(
+        agent["type"], agent["type"].title(), agent["api_port"], agent["a2a_port"], agent["agent_id"],
+        f"{{base_url}}/health", f"{{base_url}}/chat", f"{{base_url}}/multiagent/orchestrate"
+    )
+
+_JSON_HEADERS = {{"content-type": "application/json"}}
+
+AGENTS = tuple(_endpoint(agent) for agent in {json.dumps(created_agents)})
 
 async def agent_chat():
     """Interactive chat interface for multi-agent communication."""
     
-    agents = {json.dumps(created_agents)}
-    
+    _load_rich()
     console.print(Panel.fit("🤖 Multi-Agent Chat Interface", style="bold blue"))
     
     # Show available agents
     console.print("\\nAvailable agents:")
-    for i, agent in enumerate(agents):
-        console.print(f"  {{i+1}}. {{agent['type'].title()}} Agent (port {{agent['api_port']}})")
+    for i, agent in enumerate(AGENTS):
+        console.print(f"  {{i+1}}. {{agent.title}} Agent (port {{agent.api_port}})")
     
-    while True:
-        try:
-            # Select source agent
-            source_idx = int(Prompt.ask("\\nSelect source agent (number)")) - 1
-            if source_idx < 0 or source_idx >= len(agents):
-                console.print("[red]Invalid agent selection[/red]")
-                continue
+    # Async prompts so waiting for input does not block the event loop
+    session = PromptSession()
+    
+    # One pooled client for the whole session so turns reuse open connections
+    async with httpx.AsyncClient(
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    ) as client:
+        while True:
+            try:
+                # Select source agent
+                source_idx = int(await session.prompt_async("\\nSelect source agent (number): ")) - 1
+                if source_idx < 0 or source_idx >= len(AGENTS):
+                    console.print("[red]Invalid agent selection[/red]")
+                    continue
             
-            source_agent = agents[source_idx]
+                source_agent = AGENTS[source_idx]
             
-            # Get message
-            message = Prompt.ask(f"\\nMessage for {{source_agent['type'].title()}} Agent")
+                # Get message
+                message = await session.prompt_async(f"\\nMessage for {{source_agent.title}} Agent: ")
             
-            if message.lower() in ['quit', 'exit', 'q']:
-                break
+                if message.lower() in ['quit', 'exit', 'q']:
+                    break
             
-            # Send message
-            async with httpx.AsyncClient() as client:
+                # Send message
                 try:
                     response = await client.post(
-                        f"http://localhost:{{source_agent['api_port']}}/chat",
-                        json={{
+                        source_agent.chat_url,
+                        content=orjson.dumps({{
                             "content": message,
                             "session_id": "interactive-session"
-                        }}
+                        }}),
+                        headers=_JSON_HEADERS
                     )
-                    
+                
                     if response.status_code == 200:
-                        result = response.json()
-                        console.print(f"\\n[green]{{source_agent['type'].title()}} Agent:[/green]")
+                        result = orjson.loads(response.content)
+                        console.print(f"\\n[green]{{source_agent.title}} Agent:[/green]")
                         console.print(Panel(result.get('response', 'No response')))
                     else:
                         console.print(f"[red]Error: {{response.status_code}}[/red]")
-                        
+                    
                 except Exception as e:
                     console.print(f"[red]Error: {{e}}[/red]")
                     
-        except (KeyboardInterrupt, EOFError):
-            break
-        except ValueError:
-            console.print("[red]Please enter a valid number[/red]")
+            except (KeyboardInterrupt, EOFError):
+                break
+            except ValueError:
+                console.print("[red]Please enter a valid number[/red]")
     
     console.print("\\n👋 Goodbye!")
 
 if __name__ == "__main__":
-    asyncio.run(agent_chat())
+    run(agent_chat())
 '''
         
         with open(chat_script, 'w') as f:
@@ -970,7 +1301,7 @@ if __name__ == "__main__":
         raise typer.Exit(1)
 
 
-@multiagent_app.command("chat")
+@_multiagent_command("chat")
 def multiagent_chat(
     workspace: str = typer.Option(
         "multiagent_workspace",
@@ -992,6 +1323,9 @@ def multiagent_chat(
     )
 ):
     """Start interactive A2A chat between two agents."""
+    from rich.prompt import Prompt
+    
+    from .core.yaml_cache import load_yaml
     
     async def run_multiagent_chat():
         workspace_path = Path(workspace)
@@ -1002,17 +1336,11 @@ def multiagent_chat(
             raise typer.Exit(1)
         
         # Find available agents
-        config_files = list(workspace_path.glob("*_config.yaml"))
-        if not config_files:
+        available_agents = _workspace_agent_types(workspace_path)
+        if not available_agents:
             rprint(f"[red]❌ No agent configs found in {workspace}[/red]")
             raise typer.Exit(1)
         
-        available_agents = []
-        for config_file in config_files:
-            agent_type = config_file.stem.replace("_config", "")
-            if agent_type != "orchestrator":
-                available_agents.append(agent_type)
-        
         rprint(f"[blue]Available agents: {', '.join(available_agents)}[/blue]")
         
         # Initialize agent variables
@@ -1057,11 +1385,8 @@ def multiagent_chat(
             rprint(f"[red]❌ Agent configs not found[/red]")
             raise typer.Exit(1)
         
-        import yaml
-        with open(config1_file) as f:
-            config1 = yaml.safe_load(f)
-        with open(config2_file) as f:
-            config2 = yaml.safe_load(f)
+        config1 = load_yaml(config1_file)
+        config2 = load_yaml(config2_file)
         
         port1 = config1["api"]["port"]
         port2 = config2["api"]["port"]
@@ -1158,10 +1483,10 @@ def multiagent_chat(
         
         rprint("\\n[dim]👋 A2A Chat ended![/dim]")
     
-    asyncio.run(run_multiagent_chat())
+    run(run_multiagent_chat())
 
 
-@multiagent_app.command("orchestrate")
+@_multiagent_command("orchestrate")
 def orchestrate_agents(
     workspace: str = typer.Option(
         "multiagent_workspace",
@@ -1178,6 +1503,7 @@ def orchestrate_agents(
     )
 ):
     """Orchestrate a task across multiple agents."""
+    from .core.yaml_cache import load_yaml
     
     async def run_orchestration():
         workspace_path = Path(workspace)
@@ -1192,9 +1518,7 @@ def orchestrate_agents(
             rprint(f"[red]❌ Orchestrator config not found: {orchestrator_config}[/red]")
             raise typer.Exit(1)
         
-        import yaml
-        with open(orchestrator_config) as f:
-            config = yaml.safe_load(f)
+        config = load_yaml(orchestrator_config)
         
         available_agents = config["orchestrator"]["agents"]
         
@@ -1272,7 +1596,7 @@ def orchestrate_agents(
         else:
             rprint("[red]❌ No responses received from agents[/red]")
     
-    asyncio.run(run_orchestration())
+    run(run_orchestration())
 
 
 if __name__ == "__main__":
@@ -1,6 +1,25 @@
 """StrandsFlow core module."""
 
-from .agent import StrandsFlowAgent
-from .config import StrandsFlowConfig
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __all__ = ["StrandsFlowAgent", "StrandsFlowConfig"]
+
+# Loaded on first access so that importing core.config does not pull in
+# the Strands agent stack via this package __init__
+_LAZY_EXPORTS = {
+    "StrandsFlowAgent": ".agent",
+    "StrandsFlowConfig": ".config",
+}
+
+if TYPE_CHECKING:
+    from .agent import StrandsFlowAgent
+    from .config import StrandsFlowConfig
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
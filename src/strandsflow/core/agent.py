@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import structlog
+from botocore.config import Config as BotocoreConfig
 from strands import Agent
 from strands.models import BedrockModel
 from strands.tools.mcp import MCPClient
@@ -43,19 +44,36 @@ class StrandsFlowAgent:
         config: Optional[StrandsFlowConfig] = None,
         system_prompt: Optional[str] = None,
         tools: Optional[List[Any]] = None,
-        mcp_servers: Optional[List[Dict[str, Any]]] = None
+        mcp_servers: Optional[List[Dict[str, Any]]] = None,
+        boto_session: Optional[Any] = None
     ):
-        """Initialize StrandsFlow agent."""
+        """Initialize StrandsFlow agent.
+        
+        Pass ``boto_session`` to share one already-resolved boto3 session (and its
+        credentials) between several agents; its region takes precedence over
+        ``config.bedrock.region_name``.
+        """
         self.config = config or StrandsFlowConfig()
         self.system_prompt = system_prompt or self._get_default_system_prompt()
         
-        # Initialize Bedrock model
+        # Initialize Bedrock model (Strands rejects region_name together with a session)
+        if boto_session is not None:
+            session_kwargs = {"boto_session": boto_session}
+        else:
+            session_kwargs = {"region_name": self.config.bedrock.region_name}
         self.model = BedrockModel(
             model_id=self.config.bedrock.model_id,
-            region_name=self.config.bedrock.region_name,
             temperature=self.config.bedrock.temperature,
             max_tokens=self.config.bedrock.max_tokens,
             streaming=self.config.bedrock.streaming,
+            # Size the client's connection pool for concurrent requests so calls
+            # beyond botocore's default of 10 reuse connections instead of
+            # opening (and TLS-handshaking) new ones
+            boto_client_config=BotocoreConfig(
+                max_pool_connections=self.config.bedrock.max_pool_connections,
+                tcp_keepalive=True
+            ),
+            **session_kwargs,
         )
         
         # Set up tools
@@ -183,11 +201,11 @@ class StrandsFlowAgent:
                 async with asyncio.gather(*[
                     mcp_client.__aenter__() for mcp_client in self.mcp_clients
                 ]):
-                    result = self.agent(message)
+                    result = await self.agent.invoke_async(message)
                     return result.message
             else:
-                # No MCP servers, use agent directly
-                result = self.agent(message)
+                # No MCP servers, use agent directly (without blocking the event loop)
+                result = await self.agent.invoke_async(message)
                 return result.message
                 
         except Exception as e:
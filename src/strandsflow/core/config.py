@@ -75,6 +75,16 @@ class BedrockConfig(BaseModel):
         default="enabled",
         description="Guardrail trace mode ('enabled', 'disabled', 'enabled_full')"
     )
+    max_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Maximum concurrent Bedrock calls when initializing or fanning out to several agents"
+    )
+    max_pool_connections: int = Field(
+        default=50,
+        gt=0,
+        description="Maximum kept-alive HTTPS connections in each agent's Bedrock client pool"
+    )
 
 
 class MCPConfig(BaseModel):
@@ -155,6 +165,30 @@ class APIConfig(BaseModel):
         default_factory=lambda: ["*"],
         description="CORS allowed origins"
     )
+    redis_url: Optional[str] = Field(
+        default=None,
+        description="Redis URL for sessions shared across workers (in-memory if unset)"
+    )
+    max_sessions: int = Field(
+        default=10_000,
+        gt=0,
+        description="Maximum in-memory sessions kept before evicting the least recently used"
+    )
+    session_ttl: Optional[int] = Field(
+        default=3600,
+        gt=0,
+        description="Seconds a Redis session is kept after its last activity (no expiry if unset)"
+    )
+    redis_max_connections: int = Field(
+        default=50,
+        gt=0,
+        description="Maximum connections in the Redis session store's connection pool"
+    )
+    broadcast_batch_size: int = Field(
+        default=50,
+        gt=0,
+        description="WebSocket connections sent to at once per batch when broadcasting to a session"
+    )
 
 
 class EnvironmentConfig(BaseModel):
@@ -209,6 +243,10 @@ class A2AConfig(BaseModel):
         default=3,
         description="Number of retry attempts for failed A2A calls"
     )
+    local_routing: bool = Field(
+        default=True,
+        description="Route conditional tasks by capability match, asking the orchestrator model only when no specialist matches"
+    )
 
 
 class StrandsFlowConfig(BaseModel):
@@ -257,6 +295,10 @@ class StrandsFlowConfig(BaseModel):
             config.bedrock.max_tokens = int(os.getenv("BEDROCK_MAX_TOKENS"))
         if os.getenv("BEDROCK_STREAMING"):
             config.bedrock.streaming = os.getenv("BEDROCK_STREAMING").lower() == "true"
+        if os.getenv("BEDROCK_MAX_CONCURRENCY"):
+            config.bedrock.max_concurrency = int(os.getenv("BEDROCK_MAX_CONCURRENCY"))
+        if os.getenv("BEDROCK_MAX_POOL_CONNECTIONS"):
+            config.bedrock.max_pool_connections = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS"))
             
         # Agent configuration from environment
         if os.getenv("AGENT_NAME"):
@@ -271,6 +313,8 @@ class StrandsFlowConfig(BaseModel):
             config.api.host = os.getenv("API_HOST")
         if os.getenv("API_PORT"):
             config.api.port = int(os.getenv("API_PORT"))
+        if os.getenv("REDIS_URL"):
+            config.api.redis_url = os.getenv("REDIS_URL")
             
         # Environment configuration from environment
         if os.getenv("ENVIRONMENT_NAME"):
@@ -292,31 +336,31 @@ class StrandsFlowConfig(BaseModel):
     def from_file(cls, config_path: str) -> "StrandsFlowConfig":
         """Load configuration from a YAML or JSON file."""
         import json
-        import yaml
+        from .yaml_cache import load_yaml
         
         config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-            
-        with open(config_file, 'r') as f:
+        try:
             if config_file.suffix.lower() in ['.yml', '.yaml']:
-                data = yaml.safe_load(f)
+                data = load_yaml(str(config_file))
             else:
-                data = json.load(f)
+                with open(config_file, 'r') as f:
+                    data = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
                 
         return cls(**data)
     
     def save_to_file(self, config_path: str) -> None:
         """Save configuration to a YAML or JSON file."""
         import json
-        import yaml
+        from .yaml_cache import dump_yaml
         
         config_file = Path(config_path)
         config_file.parent.mkdir(parents=True, exist_ok=True)
         
         with open(config_file, 'w') as f:
             if config_file.suffix.lower() in ['.yml', '.yaml']:
-                yaml.dump(self.model_dump(), f, default_flow_style=False)
+                dump_yaml(self.model_dump(), f)
             else:
                 json.dump(self.model_dump(), f, indent=2)
 
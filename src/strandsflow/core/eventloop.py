@@ -0,0 +1,31 @@
+"""
+StrandsFlow Event Loop Selection
+
+This module runs coroutines on uvloop (winloop on Windows) when it is
+installed, falling back to the standard asyncio event loop otherwise.
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine
+
+try:
+    if sys.platform == "win32":
+        import winloop as _loop_impl
+    else:
+        import uvloop as _loop_impl
+except ImportError:
+    _loop_impl = None
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion on the fastest available event loop."""
+    if _loop_impl is None:
+        return asyncio.run(main)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=_loop_impl.new_event_loop) as runner:
+            return runner.run(main)
+
+    asyncio.set_event_loop_policy(_loop_impl.EventLoopPolicy())
+    return asyncio.run(main)
@@ -0,0 +1,62 @@
+"""
+StrandsFlow YAML Loading
+
+This module provides a small cache for parsed YAML files, keyed by each file's
+mtime, size and inode, so that configuration files read repeatedly (agent
+configs, workspace files) are only parsed again when they change on disk, plus
+a matching writer that drops the cache entry of the file it writes.
+"""
+
+import os
+from typing import IO, Any, Dict, Tuple
+
+import yaml
+
+# Prefer the libyaml C loader and dumper when PyYAML was built with them
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Absolute path -> ((st_mtime_ns, st_size, st_ino), parsed data)
+_CACHE: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def load_yaml(path: str) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    The returned object is shared between callers and should be treated as
+    read-only.
+    """
+    key = os.path.abspath(path)
+    stat = os.stat(key)
+    # Size and inode catch rewrites within one (coarse) mtime tick
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(key, 'rb') as f:
+        data = yaml.load(f, Loader=_Loader)
+
+    _CACHE[key] = (signature, data)
+    return data
+
+
+def dump_yaml(data: Any, stream: IO[str], **kwargs: Any) -> None:
+    """Write plain data as block-style YAML using the fastest safe dumper.
+
+    Keys are written in insertion order rather than sorted. When ``stream`` is
+    a file, any cached parse of that file is dropped.
+    """
+    kwargs.setdefault("default_flow_style", False)
+    kwargs.setdefault("sort_keys", False)
+    yaml.dump(data, stream, Dumper=_Dumper, **kwargs)
+
+    name = getattr(stream, "name", None)
+    if isinstance(name, str):
+        _CACHE.pop(os.path.abspath(name), None)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all cached YAML documents."""
+    _CACHE.clear()
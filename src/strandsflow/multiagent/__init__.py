@@ -4,6 +4,7 @@ from .a2a_server import A2AServer, A2AServerManager, A2AClient
 from .orchestrator import Orchestrator, WorkflowType
 from .specialist_pool import SpecialistPool, SpecialistConfig, create_predefined_pool
 from .workflow_manager import WorkflowManager, WorkflowDefinition, WorkflowStep, WorkflowStatus
+from .batch import batch_spawn
 
 __all__ = [
     "A2AServer",
@@ -17,5 +18,6 @@ __all__ = [
     "WorkflowManager",
     "WorkflowDefinition",
     "WorkflowStep",
-    "WorkflowStatus"
+    "WorkflowStatus",
+    "batch_spawn"
 ]
@@ -133,8 +133,9 @@ class A2AServer:
         self.name = name or agent.config.agent.name
         self.description = description or agent.config.agent.description
         
-        # Create wrapper
+        # Create wrapper; its tool is built on first use and then reused
         self.wrapper = AgentAsToolWrapper(agent, self.name, self.description)
+        self._tool = None
         
         # Create agent card
         self.card = AgentCard(
@@ -154,7 +155,9 @@ class A2AServer:
     
     def get_tool(self):
         """Get the tool representation of this agent."""
-        return self.wrapper.create_tool()
+        if self._tool is None:
+            self._tool = self.wrapper.create_tool()
+        return self._tool
     
     def get_card(self) -> Dict[str, Any]:
         """Get the agent card information."""
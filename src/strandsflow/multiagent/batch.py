@@ -0,0 +1,66 @@
+"""Batch creation of agents that share one Bedrock session for StrandsFlow."""
+
+from typing import Dict, List, Optional, Any
+
+try:
+    import structlog
+    logger = structlog.get_logger(__name__)
+except ImportError:
+    import logging
+    logger = logging.getLogger(__name__)
+
+from ..core.agent import StrandsFlowAgent
+from ..core.config import StrandsFlowConfig
+
+
+def batch_spawn(
+    shared_prompt: str,
+    forks: List[Dict[str, Any]],
+    base_config: Optional[StrandsFlowConfig] = None,
+    boto_session: Optional[Any] = None
+) -> Dict[str, StrandsFlowAgent]:
+    """
+    Create several agents from a shared system prompt and one boto3 session.
+
+    Each fork is a dict with an ``id`` and optionally a ``role_delta`` (text
+    appended to ``shared_prompt``) and a ``port`` (API port for that agent).
+    Credentials and region are resolved once and reused by every agent instead
+    of each agent building its own session.
+
+    Returns:
+        Mapping of fork id to the created (uninitialized) agent.
+    """
+    # Reject duplicate ids before any agent (and its Bedrock client) is built
+    seen = set()
+    for fork in forks:
+        if fork["id"] in seen:
+            raise ValueError(f"Duplicate agent id '{fork['id']}'")
+        seen.add(fork["id"])
+
+    if base_config is None:
+        base_config = StrandsFlowConfig()
+
+    if boto_session is None:
+        import boto3
+        boto_session = boto3.Session(region_name=base_config.bedrock.region_name)
+
+    agents: Dict[str, StrandsFlowAgent] = {}
+    for fork in forks:
+        agent_id = fork["id"]
+        config = base_config.model_copy(deep=True)
+        config.agent.name = agent_id
+        if fork.get("port") is not None:
+            config.api.port = fork["port"]
+
+        role_delta = fork.get("role_delta")
+        system_prompt = f"{shared_prompt}\n\n{role_delta}" if role_delta else shared_prompt
+
+        agents[agent_id] = StrandsFlowAgent(
+            config=config,
+            system_prompt=system_prompt,
+            boto_session=boto_session
+        )
+
+    logger.info("Spawned agent batch", count=len(agents))
+
+    return agents
@@ -1,8 +1,10 @@
 """Orchestrator for multi-agent workflows in StrandsFlow."""
 
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Union
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
 try:
@@ -19,6 +21,33 @@ from ..core.agent import StrandsFlowAgent
 from .a2a_server import A2AServerManager, A2AServer
 
 
+_WORD_RE = re.compile(r"[a-z0-9]+")
+_SUFFIXES = ("ations", "ation", "ions", "ing", "ion", "ics", "ed", "er", "es", "s", "e")
+
+# Function words and generic request words; they appear in almost every task,
+# so left in they would outvote the words that actually name a capability
+_STOPWORDS = frozenset("""
+    a an and are as at be but by can could do does for from get give has have
+    help how i in is it its make me my need of on or our please should so some
+    that the their them then there these this those to us want we what when
+    which who why will with would you your
+""".split())
+
+
+def _terms(text: str) -> frozenset:
+    """Reduce text to crude word stems for capability matching."""
+    stems = set()
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        for suffix in _SUFFIXES:
+            if len(word) > len(suffix) + 2 and word.endswith(suffix):
+                word = word[:-len(suffix)]
+                break
+        stems.add(word[:5])
+    return frozenset(stems)
+
+
 class WorkflowType(Enum):
     """Types of multi-agent workflows."""
     SEQUENTIAL = "sequential"
@@ -41,12 +70,28 @@ class Orchestrator:
     def __init__(
         self,
         config_path: Optional[str] = None,
-        a2a_manager: Optional[A2AServerManager] = None
+        a2a_manager: Optional[A2AServerManager] = None,
+        max_concurrency: Optional[int] = None,
+        local_routing: bool = False
     ):
-        """Initialize the orchestrator."""
+        """Initialize the orchestrator.
+        
+        ``max_concurrency`` caps how many specialists a parallel workflow calls
+        at once (to stay under Bedrock rate limits); ``None`` means no cap.
+        With ``local_routing`` enabled, conditional workflows send a task
+        straight to the specialist picked by :meth:`route` and only ask the
+        orchestrator model when no specialist matches.
+        """
         self.agents: Dict[str, StrandsFlowAgent] = {}
         self.a2a_manager = a2a_manager or A2AServerManager()
         self.orchestrator_agent: Optional[Agent] = None
+        self.specialist_tools: Tuple[Any, ...] = ()
+        self.max_concurrency = max_concurrency
+        self.local_routing = local_routing
+        
+        # Specialist name -> stems of its role and capabilities
+        self._capability_terms: Dict[str, frozenset] = {}
+        self._route_cached = functools.lru_cache(maxsize=1024)(self._score_route)
         
         logger.info("Orchestrator initialized")
     
@@ -66,6 +111,8 @@ class Orchestrator:
         # Store metadata
         agent._role = role
         agent._capabilities = capabilities
+        self._capability_terms[name] = _terms(" ".join([role, *capabilities]).replace("_", " "))
+        self._route_cached.cache_clear()
         
         logger.info(
             "Added specialist agent",
@@ -79,8 +126,8 @@ class Orchestrator:
         if not system_prompt:
             system_prompt = self._get_default_orchestrator_prompt()
         
-        # Get tools for all specialist agents
-        specialist_tools = self.a2a_manager.get_agent_tools()
+        # Snapshot the specialist tools once; workflows reuse this agent
+        self.specialist_tools = tuple(self.a2a_manager.get_agent_tools())
         
         # Create orchestrator with specialist tools
         from strands.models import BedrockModel
@@ -92,7 +139,7 @@ class Orchestrator:
             temperature=0.3
         )
         
-        all_tools = [calculator, current_time, file_read, python_repl] + specialist_tools
+        all_tools = [calculator, current_time, file_read, python_repl, *self.specialist_tools]
         
         self.orchestrator_agent = Agent(
             model=model,
@@ -194,23 +241,28 @@ class Orchestrator:
         if not agent_names:
             agent_names = list(self.agents.keys())
         
-        # Create tasks for parallel execution
-        tasks = []
-        for agent_name in agent_names:
-            if agent_name in self.agents:
-                agent = self.agents[agent_name]
-                task_coroutine = self._run_agent_task(agent, agent_name, task)
-                tasks.append(task_coroutine)
+        agent_names = [name for name in agent_names if name in self.agents]
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        
+        async def run_limited(agent_name: str) -> Dict[str, Any]:
+            agent = self.agents[agent_name]
+            if semaphore is None:
+                return await self._run_agent_task(agent, agent_name, task)
+            async with semaphore:
+                return await self._run_agent_task(agent, agent_name, task)
         
         # Execute in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *[run_limited(agent_name) for agent_name in agent_names],
+            return_exceptions=True
+        )
         
         # Process results
         processed_results = []
-        for i, result in enumerate(results):
+        for agent_name, result in zip(agent_names, results):
             if isinstance(result, Exception):
                 processed_results.append({
-                    "agent": agent_names[i],
+                    "agent": agent_name,
                     "status": "error",
                     "error": str(result)
                 })
@@ -223,8 +275,41 @@ class Orchestrator:
             "results": processed_results
         }
     
+    def route(self, task: str) -> Optional[str]:
+        """Pick a specialist for a task by matching it against their capabilities.
+        
+        This is a local lexical match (no model call); results are cached per
+        task text until a specialist is added. Returns ``None`` when no
+        specialist's role or capabilities appear in the task; on a tie the
+        specialist added first wins.
+        """
+        return self._route_cached(task)
+    
+    def _score_route(self, task: str) -> Optional[str]:
+        """Return the specialist sharing the most terms with the task."""
+        task_terms = _terms(task)
+        best_name, best_score = None, 0
+        for name, terms in self._capability_terms.items():
+            score = len(task_terms & terms)
+            if score > best_score:
+                best_name, best_score = name, score
+        return best_name
+    
     async def _execute_conditional(self, task: str) -> Dict[str, Any]:
         """Use orchestrator to intelligently route task to appropriate specialist."""
+        if self.local_routing:
+            agent_name = self.route(task)
+            if agent_name is not None:
+                result = await self._run_agent_task(self.agents[agent_name], agent_name, task)
+                return {
+                    "status": "success",
+                    "workflow_type": "conditional",
+                    "routing_decision": f"Routed to {agent_name} by capability match",
+                    "routed_to": agent_name,
+                    "result": result,
+                    "task": task
+                }
+        
         routing_prompt = f"""
         Analyze this task and route it to the most appropriate specialist agent:
         
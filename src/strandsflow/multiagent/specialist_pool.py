@@ -1,5 +1,6 @@
 """Specialist agent pool for StrandsFlow multi-agent system."""
 
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -36,13 +37,33 @@ class SpecialistPool:
     for specific types of tasks or domains.
     """
     
-    def __init__(self):
-        """Initialize the specialist pool."""
+    def __init__(self, boto_session: Optional[Any] = None):
+        """Initialize the specialist pool.
+        
+        Specialists share one boto3 session per region so that credentials and
+        botocore service models are loaded once for the whole pool. Pass
+        ``boto_session`` to use a caller-provided session for every specialist.
+        """
         self.specialists: Dict[str, StrandsFlowAgent] = {}
         self.configs: Dict[str, SpecialistConfig] = {}
+        self._boto_session = boto_session
+        self._boto_sessions: Dict[str, Any] = {}
+        self._listing_cache: Optional[Dict[str, Dict[str, Any]]] = None
         
         logger.info("Specialist pool initialized")
     
+    def _get_boto_session(self, region_name: str) -> Any:
+        """Return the shared boto3 session for a region, creating it on first use."""
+        if self._boto_session is not None:
+            return self._boto_session
+        
+        session = self._boto_sessions.get(region_name)
+        if session is None:
+            import boto3
+            session = boto3.Session(region_name=region_name)
+            self._boto_sessions[region_name] = session
+        return session
+    
     async def add_specialist(
         self,
         config: SpecialistConfig,
@@ -52,23 +73,30 @@ class SpecialistPool:
         if config.name in self.specialists:
             raise ValueError(f"Specialist '{config.name}' already exists")
         
-        # Create agent configuration
+        # Create agent configuration; a shared base config is copied so that
+        # concurrent additions do not overwrite each other's settings
         if base_config is None:
-            base_config = StrandsFlowConfig()
+            agent_config = StrandsFlowConfig()
+        else:
+            agent_config = base_config.model_copy(deep=True)
         
         # Override with specialist-specific settings
-        base_config.agent.name = config.name
-        base_config.agent.description = config.description
-        base_config.agent.system_prompt = config.system_prompt
-        base_config.bedrock.model_id = config.model_id
-        base_config.bedrock.temperature = config.temperature
+        agent_config.agent.name = config.name
+        agent_config.agent.description = config.description
+        agent_config.agent.system_prompt = config.system_prompt
+        agent_config.bedrock.model_id = config.model_id
+        agent_config.bedrock.temperature = config.temperature
         
         # Create specialist agent
-        specialist = StrandsFlowAgent(config=base_config)
+        specialist = StrandsFlowAgent(
+            config=agent_config,
+            boto_session=self._get_boto_session(agent_config.bedrock.region_name)
+        )
         
         # Store
         self.specialists[config.name] = specialist
         self.configs[config.name] = config
+        self._listing_cache = None
         
         logger.info(
             "Added specialist",
@@ -84,18 +112,24 @@ class SpecialistPool:
         return self.specialists.get(name)
     
     def list_specialists(self) -> Dict[str, Dict[str, Any]]:
-        """List all specialists with their metadata."""
-        result = {}
-        for name, config in self.configs.items():
-            result[name] = {
-                "name": config.name,
-                "role": config.role,
-                "description": config.description,
-                "capabilities": config.capabilities,
-                "model_id": config.model_id,
-                "temperature": config.temperature
+        """List all specialists with their metadata.
+        
+        The listing is built once and reused until a specialist is added or
+        removed; callers should treat it as read-only.
+        """
+        if self._listing_cache is None:
+            self._listing_cache = {
+                name: {
+                    "name": config.name,
+                    "role": config.role,
+                    "description": config.description,
+                    "capabilities": config.capabilities,
+                    "model_id": config.model_id,
+                    "temperature": config.temperature
+                }
+                for name, config in self.configs.items()
             }
-        return result
+        return self._listing_cache
     
     def find_specialists_by_capability(self, capability: str) -> List[str]:
         """Find specialists that have a specific capability."""
@@ -126,27 +160,48 @@ class SpecialistPool:
         # Remove from pool
         del self.specialists[name]
         del self.configs[name]
+        self._listing_cache = None
         
         logger.info("Removed specialist", name=name)
         return True
     
-    async def initialize_all(self) -> None:
-        """Initialize all specialists in the pool."""
-        for name, specialist in self.specialists.items():
+    async def initialize_all(self, max_concurrency: Optional[int] = 4) -> None:
+        """Initialize all specialists in the pool concurrently.
+        
+        At most ``max_concurrency`` specialists initialize at once so that large
+        pools stay under Bedrock rate limits; ``None`` means no cap.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        
+        async def initialize_one(name: str, specialist: StrandsFlowAgent) -> None:
             try:
-                await specialist.initialize()
+                if semaphore is None:
+                    await specialist.initialize()
+                else:
+                    async with semaphore:
+                        await specialist.initialize()
                 logger.info(f"Initialized specialist: {name}")
             except Exception as e:
                 logger.error(f"Failed to initialize specialist {name}: {e}")
+        
+        await asyncio.gather(*[
+            initialize_one(name, specialist)
+            for name, specialist in self.specialists.items()
+        ])
     
     async def shutdown_all(self) -> None:
-        """Shutdown all specialists in the pool."""
-        for name, specialist in self.specialists.items():
+        """Shutdown all specialists in the pool concurrently."""
+        async def shutdown_one(name: str, specialist: StrandsFlowAgent) -> None:
             try:
                 await specialist.shutdown()
                 logger.info(f"Shutdown specialist: {name}")
             except Exception as e:
                 logger.warning(f"Error shutting down specialist {name}: {e}")
+        
+        await asyncio.gather(*[
+            shutdown_one(name, specialist)
+            for name, specialist in self.specialists.items()
+        ])
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get pool metrics."""
@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Callable
+from typing import Any, AsyncIterator, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -83,6 +83,8 @@ class WorkflowManager:
         
         self.workflows: Dict[str, WorkflowDefinition] = {}
         self.executions: Dict[str, WorkflowExecution] = {}
+        self._completion_events: Dict[str, asyncio.Event] = {}
+        self._step_queues: Dict[str, asyncio.Queue] = {}
         
         # Predefined workflows
         self._register_predefined_workflows()
@@ -117,8 +119,21 @@ class WorkflowManager:
         
         self.executions[exec_id] = execution
         
-        # Start execution in background
-        asyncio.create_task(self._run_workflow(exec_id, workflow, inputs))
+        # Start execution in background and signal waiters when it finishes
+        completion_event = asyncio.Event()
+        step_queue: asyncio.Queue = asyncio.Queue()
+        self._completion_events[exec_id] = completion_event
+        self._step_queues[exec_id] = step_queue
+        
+        def on_done(_: asyncio.Task) -> None:
+            completion_event.set()
+            step_queue.put_nowait(None)
+            # Finished executions are served from ``self.executions``
+            self._completion_events.pop(exec_id, None)
+            self._step_queues.pop(exec_id, None)
+        
+        task = asyncio.create_task(self._run_workflow(exec_id, workflow, inputs, step_queue))
+        task.add_done_callback(on_done)
         
         return exec_id
     
@@ -126,9 +141,10 @@ class WorkflowManager:
         self,
         execution_id: str,
         workflow: WorkflowDefinition,
-        inputs: Dict[str, Any]
+        inputs: Dict[str, Any],
+        step_queue: asyncio.Queue
     ) -> None:
-        """Run a workflow execution."""
+        """Run a workflow execution, reporting finished steps on ``step_queue``."""
         import time
         
         execution = self.executions[execution_id]
@@ -169,6 +185,7 @@ class WorkflowManager:
                         completed_steps.add(step_name)
                         execution.results["steps"][step_name] = result
                         execution.current_step = step_name
+                        step_queue.put_nowait((step_name, result))
                         
                         logger.info(f"Completed step {step_name} in workflow {execution_id}")
                         
@@ -320,6 +337,58 @@ class WorkflowManager:
         """Get workflow execution status."""
         return self.executions.get(execution_id)
     
+    async def wait_for_completion(
+        self,
+        execution_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[WorkflowExecution]:
+        """Wait until a workflow execution finishes and return its state.
+        
+        Returns the execution as it stands if ``timeout`` seconds pass first.
+        """
+        event = self._completion_events.get(execution_id)
+        if event is not None:
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out waiting for workflow {execution_id}")
+        
+        return self.executions.get(execution_id)
+    
+    async def stream_results(
+        self,
+        execution_id: str,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield ``(step_name, result)`` pairs as workflow steps complete.
+        
+        Steps finished before iteration starts are yielded first. Iteration ends
+        when the workflow finishes, or once ``timeout`` seconds have passed in
+        total. A running execution can be streamed live once; later calls (and
+        calls after the workflow finished) yield the steps recorded so far.
+        """
+        queue = self._step_queues.pop(execution_id, None)
+        if queue is None:
+            execution = self.executions.get(execution_id)
+            if execution is not None and execution.results:
+                for item in list(execution.results.get("steps", {}).items()):
+                    yield item
+            return
+        
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                item = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                logger.warning(f"Timed out waiting for workflow {execution_id}")
+                return
+            
+            if item is None:
+                return
+            yield item
+    
     def list_workflows(self) -> Dict[str, Dict[str, Any]]:
         """List all available workflows."""
         return {
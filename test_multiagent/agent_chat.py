@@ -3,70 +3,109 @@
 Interactive Agent-to-Agent Chat Interface
 """
 
-import asyncio
 import httpx
 import json
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.panel import Panel
+import orjson
+from typing import NamedTuple
+from prompt_toolkit import PromptSession
 
-console = Console()
+from strandsflow.core.eventloop import run
+
+# rich is imported on first use so importing this module stays cheap
+console = None
+Panel = None
+
+def _load_rich():
+    """Import rich and create the console."""
+    global console, Panel
+    from rich.console import Console
+    from rich.panel import Panel
+    console = Console()
+
+class AgentEndpoint(NamedTuple):
+    """Connection details for one agent, with its URLs formatted once."""
+    type: str
+    title: str
+    api_port: int
+    a2a_port: int
+    agent_id: str
+    health_url: str
+    chat_url: str
+    orchestrate_url: str
+
+def _endpoint(agent):
+    base_url = f"http://localhost:{agent['api_port']}"
+    return AgentEndpoint(
+        agent["type"], agent["type"].title(), agent["api_port"], agent["a2a_port"], agent["agent_id"],
+        f"{base_url}/health", f"{base_url}/chat", f"{base_url}/multiagent/orchestrate"
+    )
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+AGENTS = tuple(_endpoint(agent) for agent in [{"type": "assistant", "config_file": "test_multiagent/assistant_config.yaml", "api_port": 8010, "a2a_port": 8110, "agent_id": "assistant_agent"}, {"type": "researcher", "config_file": "test_multiagent/researcher_config.yaml", "api_port": 8011, "a2a_port": 8111, "agent_id": "researcher_agent"}])
 
 async def agent_chat():
     """Interactive chat interface for multi-agent communication."""
     
-    agents = [{"type": "assistant", "config_file": "test_multiagent/assistant_config.yaml", "api_port": 8010, "a2a_port": 8110, "agent_id": "assistant_agent"}, {"type": "researcher", "config_file": "test_multiagent/researcher_config.yaml", "api_port": 8011, "a2a_port": 8111, "agent_id": "researcher_agent"}]
-    
+    _load_rich()
     console.print(Panel.fit("🤖 Multi-Agent Chat Interface", style="bold blue"))
     
     # Show available agents
     console.print("\nAvailable agents:")
-    for i, agent in enumerate(agents):
-        console.print(f"  {i+1}. {agent['type'].title()} Agent (port {agent['api_port']})")
+    for i, agent in enumerate(AGENTS):
+        console.print(f"  {i+1}. {agent.title} Agent (port {agent.api_port})")
+    
+    # Async prompts so waiting for input does not block the event loop
+    session = PromptSession()
     
-    while True:
-        try:
-            # Select source agent
-            source_idx = int(Prompt.ask("\nSelect source agent (number)")) - 1
-            if source_idx < 0 or source_idx >= len(agents):
-                console.print("[red]Invalid agent selection[/red]")
-                continue
+    # One pooled client for the whole session so turns reuse open connections
+    async with httpx.AsyncClient(
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    ) as client:
+        while True:
+            try:
+                # Select source agent
+                source_idx = int(await session.prompt_async("\nSelect source agent (number): ")) - 1
+                if source_idx < 0 or source_idx >= len(AGENTS):
+                    console.print("[red]Invalid agent selection[/red]")
+                    continue
             
-            source_agent = agents[source_idx]
+                source_agent = AGENTS[source_idx]
             
-            # Get message
-            message = Prompt.ask(f"\nMessage for {source_agent['type'].title()} Agent")
+                # Get message
+                message = await session.prompt_async(f"\nMessage for {source_agent.title} Agent: ")
             
-            if message.lower() in ['quit', 'exit', 'q']:
-                break
+                if message.lower() in ['quit', 'exit', 'q']:
+                    break
             
-            # Send message
-            async with httpx.AsyncClient() as client:
+                # Send message
                 try:
                     response = await client.post(
-                        f"http://localhost:{source_agent['api_port']}/chat",
-                        json={
+                        source_agent.chat_url,
+                        content=orjson.dumps({
                             "content": message,
                             "session_id": "interactive-session"
-                        }
+                        }),
+                        headers=_JSON_HEADERS
                     )
-                    
+                
                     if response.status_code == 200:
-                        result = response.json()
-                        console.print(f"\n[green]{source_agent['type'].title()} Agent:[/green]")
+                        result = orjson.loads(response.content)
+                        console.print(f"\n[green]{source_agent.title} Agent:[/green]")
                         console.print(Panel(result.get('response', 'No response')))
                     else:
                         console.print(f"[red]Error: {response.status_code}[/red]")
-                        
+                    
                 except Exception as e:
                     console.print(f"[red]Error: {e}[/red]")
                     
-        except (KeyboardInterrupt, EOFError):
-            break
-        except ValueError:
-            console.print("[red]Please enter a valid number[/red]")
+            except (KeyboardInterrupt, EOFError):
+                break
+            except ValueError:
+                console.print("[red]Please enter a valid number[/red]")
     
     console.print("\n👋 Goodbye!")
 
 if __name__ == "__main__":
-    asyncio.run(agent_chat())
+    run(agent_chat())
@@ -2,16 +2,13 @@
 """
 Simple A2A Communication Test
 Tests agent creation and communication setup without full server startup.
+Requires StrandsFlow to be installed (``pip install -e .``).
 """
 
-import sys
 import os
 import asyncio
 from pathlib import Path
 
-# Add the source directory to Python path
-sys.path.insert(0, "/Users/annmariyajoshy/vibecoding/strands_agent/src")
-
 async def test_agent_creation():
     """Test creating and configuring two agents for communication."""
     
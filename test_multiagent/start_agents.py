@@ -5,19 +5,67 @@ Starts all agents and enables A2A communication.
 """
 
 import asyncio
-import subprocess
-import time
+import httpx
+import multiprocessing
 import sys
-import os
 from pathlib import Path
 
+import uvicorn
+
+# Import the API stack once in the parent; on Linux, forked agent processes
+# inherit the loaded modules instead of booting a fresh interpreter each. The
+# agent module is imported explicitly because the API app only loads it on
+# first use. The parent creates no AWS clients, so none are shared by forks.
+import strandsflow.api.app as api
+import strandsflow.core.agent  # noqa: F401
+from strandsflow.core.config import StrandsFlowConfig
+from strandsflow.core.eventloop import run
+
+# Fork is unsafe with macOS system frameworks, so other platforms use spawn
+_MP = multiprocessing.get_context("fork" if sys.platform == "linux" else "spawn")
+
+def serve_agent(config_file):
+    """Run one agent's API server with its own configuration."""
+    config = StrandsFlowConfig.from_file(config_file)
+    api.config = config
+    uvicorn.run(api.app, host=config.api.host, port=config.api.port, log_level="info")
+
 def start_agent_server(config_file, agent_type):
     """Start an agent server in the background."""
-    env = os.environ.copy()
-    env['PYTHONPATH'] = "/Users/annmariyajoshy/vibecoding/strands_agent/src:" + env.get('PYTHONPATH', '')
-    cmd = [sys.executable, "-m", "strandsflow", "server", "--config", config_file]
     print(f"Starting {agent_type} agent: {config_file}")
-    return subprocess.Popen(cmd, env=env)
+    process = _MP.Process(target=serve_agent, args=(config_file,), name=f"{agent_type}_agent")
+    process.start()
+    return process
+
+READY_TIMEOUT = 60.0
+
+async def wait_ready(client, port, process, timeout=READY_TIMEOUT):
+    """Poll an agent's health endpoint until it responds.
+    
+    Fails as soon as the agent process exits, or after ``timeout`` seconds.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while process.is_alive():
+        try:
+            response = await client.get(f"http://localhost:{port}/health")
+            if response.status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        if loop.time() >= deadline:
+            raise TimeoutError(f"{process.name} not ready on port {port} after {timeout:.0f}s")
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"{process.name} exited with code {process.exitcode} before becoming ready")
+
+async def wait_all_ready(client, servers):
+    """Wait for every ``(port, process)`` server, stopping at the first failure."""
+    tasks = [asyncio.ensure_future(wait_ready(client, port, process)) for port, process in servers]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 async def main():
     """Start all agents and wait."""
@@ -25,21 +73,27 @@ async def main():
     workspace = Path("test_multiagent")
     processes = []
     
-    agents = ["assistant", "researcher"]
+    agents = [{"type": "assistant", "config_file": "test_multiagent/assistant_config.yaml", "api_port": 8010, "a2a_port": 8110, "agent_id": "assistant_agent"}, {"type": "researcher", "config_file": "test_multiagent/researcher_config.yaml", "api_port": 8011, "a2a_port": 8111, "agent_id": "researcher_agent"}]
     
     try:
-        # Start all agent servers
-        for agent_type in agents:
-            config_file = workspace / f"{agent_type}_config.yaml"
+        # Start all agent servers at once
+        started = []
+        for agent in agents:
+            config_file = workspace / f"{agent['type']}_config.yaml"
             if config_file.exists():
-                process = start_agent_server(str(config_file), agent_type)
-                processes.append(process)
-                time.sleep(2)  # Stagger startup
+                processes.append(start_agent_server(str(config_file), agent['type']))
+                started.append(agent)
+        
+        # Wait until every server answers its health check
+        async with httpx.AsyncClient(timeout=1.0) as client:
+            await wait_all_ready(
+                client, [(agent['api_port'], process) for agent, process in zip(started, processes)]
+            )
         
         print(f"\n🚀 Started {len(processes)} agents!")
         print("\nAgent endpoints:")
-        print("  Assistant: http://localhost:8010")
-        print("  Researcher: http://localhost:8011")
+        for agent in started:
+            print(f"  {agent['type'].title()}: http://localhost:{agent['api_port']}")
         
         print("\nPress Ctrl+C to stop all agents...")
         
@@ -47,16 +101,20 @@ async def main():
         while True:
             await asyncio.sleep(1)
             
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # run() delivers Ctrl+C to the main task as a cancellation
         print("\n🛑 Stopping all agents...")
+    except (RuntimeError, TimeoutError) as e:
+        print(f"\n❌ {e}")
+        print("🛑 Stopping all agents...")
+    finally:
         for process in processes:
             process.terminate()
         
-        # Wait for clean shutdown
-        for process in processes:
-            process.wait()
+        # Wait for clean shutdown of all agents in parallel
+        await asyncio.gather(*(asyncio.to_thread(process.join) for process in processes))
         
         print("✅ All agents stopped.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -0,0 +1,231 @@
+"""Test suite for the StrandsFlow API streaming endpoints."""
+
+import asyncio
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import strandsflow.api.app as api
+from strandsflow.api.sessions import InMemorySessionStore
+from strandsflow.core.config import StrandsFlowConfig
+
+
+class FakeAgent:
+    """Agent stand-in streaming fixed chunks, optionally failing after them."""
+
+    def __init__(self, chunks=("Hello", ", ", "world"), error=None):
+        self.config = StrandsFlowConfig()
+        self.chunks = chunks
+        self.error = error
+
+    async def chat_async(self, message: str):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+    def get_metrics(self):
+        return {}
+
+
+@pytest.fixture
+def fake_agent():
+    return FakeAgent()
+
+
+@pytest.fixture
+def client(monkeypatch, fake_agent):
+    """A TestClient whose app uses the fake agent and an in-memory session store."""
+    monkeypatch.setattr(api, "config", StrandsFlowConfig())
+    monkeypatch.setattr(api, "agent", fake_agent)
+    monkeypatch.setattr(api, "sessions", InMemorySessionStore())
+    api.get_config.cache_clear()
+    api.get_agent.cache_clear()
+    with TestClient(api.app) as test_client:
+        yield test_client
+    api.get_config.cache_clear()
+    api.get_agent.cache_clear()
+
+
+def read_events(response):
+    """Split a server-sent event stream into its decoded data payloads."""
+    events = []
+    for block in response.text.split("\n\n"):
+        if not block:
+            continue
+        lines = block.split("\n")
+        assert len(lines) == 1 and lines[0].startswith("data: ")
+        events.append(orjson.loads(lines[0][len("data: "):]))
+    return events
+
+
+class TestChatStream:
+    """Test the server-sent events chat endpoint."""
+
+    def test_streams_chunks_then_complete(self, client):
+        response = client.post("/chat/stream", json={"content": "hi", "session_id": "s1"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["x-session-id"] == "s1"
+
+        events = read_events(response)
+        assert events[:-1] == [
+            {"type": "chunk", "content": "Hello"},
+            {"type": "chunk", "content": ", "},
+            {"type": "chunk", "content": "world"}
+        ]
+        assert events[-1] == {"type": "complete", "session_id": "s1", "conversation_count": 1}
+
+        session = client.get("/sessions/s1").json()
+        assert session["messages"][0]["agent"] == "Hello, world"
+
+    def test_generates_session_id(self, client):
+        response = client.post("/chat/stream", json={"content": "hi"})
+
+        session_id = response.headers["x-session-id"]
+        assert session_id
+        assert read_events(response)[-1]["session_id"] == session_id
+
+    def test_agent_error_ends_stream_with_error_event(self, client, fake_agent):
+        fake_agent.chunks = ("partial",)
+        fake_agent.error = RuntimeError("model unavailable")
+
+        response = client.post("/chat/stream", json={"content": "hi", "session_id": "s1"})
+
+        assert response.status_code == 200
+        events = read_events(response)
+        assert events == [
+            {"type": "chunk", "content": "partial"},
+            {"type": "error", "message": "Error: model unavailable"}
+        ]
+        # A failed exchange is not recorded
+        assert client.get("/sessions/s1").json()["conversation_count"] == 0
+
+    def test_rejects_invalid_request(self, client):
+        response = client.post("/chat/stream", json={"content": ""})
+
+        assert response.status_code == 422
+
+
+def receive_until_complete(receive):
+    """Collect frames from a websocket until the complete or error frame."""
+    frames = []
+    while True:
+        frames.append(receive())
+        if frames[-1]["type"] in ("complete", "error"):
+            return frames
+
+
+class TestWebSocketEncoding:
+    """Test the WebSocket subprotocol negotiation."""
+
+    def test_msgpack_when_offered(self, client):
+        ormsgpack = pytest.importorskip("ormsgpack")
+
+        with client.websocket_connect("/ws/s1", subprotocols=[api.MSGPACK_SUBPROTOCOL]) as websocket:
+            assert websocket.accepted_subprotocol == api.MSGPACK_SUBPROTOCOL
+
+            def receive():
+                return ormsgpack.unpackb(websocket.receive_bytes())
+
+            assert receive()["type"] == "connection"
+            websocket.send_bytes(ormsgpack.packb({"type": "chat", "message": "hi"}))
+            frames = receive_until_complete(receive)
+
+        assert frames[0]["type"] == "typing"
+        assert "".join(f["content"] for f in frames if f["type"] == "chunk") == "Hello, world"
+        assert frames[-1] == {
+            "type": "complete",
+            "message": "Hello, world",
+            "session_id": "s1",
+            "conversation_count": 1
+        }
+
+    def test_json_when_msgpack_not_offered(self, client):
+        with client.websocket_connect("/ws/s1") as websocket:
+            assert websocket.accepted_subprotocol is None
+
+            def receive():
+                return orjson.loads(websocket.receive_text())
+
+            assert receive()["type"] == "connection"
+            websocket.send_text(orjson.dumps({"type": "chat", "message": "hi"}).decode())
+            frames = receive_until_complete(receive)
+
+        assert "".join(f["content"] for f in frames if f["type"] == "chunk") == "Hello, world"
+        assert frames[-1]["message"] == "Hello, world"
+
+    def test_json_when_msgpack_unavailable(self, client, monkeypatch):
+        """Without ormsgpack the server declines the subprotocol and speaks JSON."""
+        monkeypatch.setattr(api, "ormsgpack", None)
+
+        with client.websocket_connect("/ws/s1", subprotocols=[api.MSGPACK_SUBPROTOCOL]) as websocket:
+            assert websocket.accepted_subprotocol is None
+            assert orjson.loads(websocket.receive_text())["type"] == "connection"
+
+    def test_agent_error_sends_error_frame(self, client, fake_agent):
+        fake_agent.error = RuntimeError("model unavailable")
+
+        with client.websocket_connect("/ws/s1") as websocket:
+            websocket.receive_text()
+            websocket.send_text(orjson.dumps({"type": "chat", "message": "hi"}).decode())
+            frames = receive_until_complete(lambda: orjson.loads(websocket.receive_text()))
+
+        assert frames[-1] == {"type": "error", "message": "Error: model unavailable", "session_id": "s1"}
+
+
+class FakeWebSocket:
+    """Records the ASGI messages sent through ``send``."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+
+async def burst(chunks):
+    """Yield chunks without suspending, so they all queue before any frame is sent."""
+    for chunk in chunks:
+        yield chunk
+
+
+class TestStreamChunks:
+    """Test batching streamed chunks into WebSocket frames."""
+
+    def stream(self, chunks):
+        websocket = FakeWebSocket()
+        full_text = asyncio.run(api._stream_chunks(websocket, "s1", burst(chunks)))
+        frames = [orjson.loads(message["text"]) for message in websocket.sent]
+        return full_text, frames
+
+    def test_batches_small_deltas_up_to_frame_limit(self):
+        deltas = [f"tok{i:04d} " for i in range(1500)]
+        full_text, frames = self.stream(deltas)
+
+        assert len(frames) > 1
+        assert all(frame["type"] == "chunk" and frame["session_id"] == "s1" for frame in frames)
+        sizes = [len(frame["content"]) for frame in frames]
+        # A frame closes at the first delta reaching the limit, never mid-delta
+        for size in sizes[:-1]:
+            assert api.MAX_CHUNK_FRAME_CHARS <= size < api.MAX_CHUNK_FRAME_CHARS + len(deltas[0])
+            assert size % len(deltas[0]) == 0
+        assert 0 < sizes[-1] <= api.MAX_CHUNK_FRAME_CHARS + len(deltas[0])
+
+    def test_no_text_is_lost(self):
+        deltas = [f"tok{i} " for i in range(2000)]
+        full_text, frames = self.stream(deltas)
+
+        assert full_text == "".join(deltas)
+        assert "".join(frame["content"] for frame in frames) == full_text
+
+    def test_non_string_chunks_are_converted(self):
+        full_text, frames = self.stream(["a", 1, None])
+
+        assert full_text == "a1None"
+        assert frames == [{"type": "chunk", "session_id": "s1", "content": "a1None"}]
+
+    def test_empty_stream_sends_nothing(self):
+        assert self.stream([]) == ("", [])
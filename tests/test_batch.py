@@ -0,0 +1,85 @@
+"""Test suite for StrandsFlow batch agent creation."""
+
+import pytest
+
+import strandsflow.multiagent.batch as batch
+from strandsflow.core.config import StrandsFlowConfig
+
+
+class FakeAgent:
+    """Records the arguments batch_spawn builds each agent with."""
+
+    created = []
+    fail_on = None
+
+    def __init__(self, config, system_prompt, boto_session):
+        if config.agent.name == self.fail_on:
+            raise RuntimeError(f"cannot create {config.agent.name}")
+        self.config = config
+        self.system_prompt = system_prompt
+        self.boto_session = boto_session
+        FakeAgent.created.append(self)
+
+
+@pytest.fixture(autouse=True)
+def fake_agent(monkeypatch):
+    monkeypatch.setattr(batch, "StrandsFlowAgent", FakeAgent)
+    monkeypatch.setattr(FakeAgent, "created", [])
+    monkeypatch.setattr(FakeAgent, "fail_on", None)
+    return FakeAgent
+
+
+class TestBatchSpawn:
+    """Test spawning agents that share a prompt and a session."""
+
+    def test_forks_share_session_and_prompt(self):
+        session = object()
+        agents = batch.batch_spawn(
+            "You are helpful.",
+            [{"id": "a", "role_delta": "Focus on code.", "port": 9001}, {"id": "b"}],
+            boto_session=session
+        )
+
+        assert list(agents) == ["a", "b"]
+        assert agents["a"].system_prompt == "You are helpful.\n\nFocus on code."
+        assert agents["b"].system_prompt == "You are helpful."
+        assert all(agent.boto_session is session for agent in agents.values())
+
+    def test_configs_are_independent_copies(self):
+        base = StrandsFlowConfig()
+        agents = batch.batch_spawn("p", [{"id": "a", "port": 9001}, {"id": "b"}], base, object())
+
+        assert agents["a"].config.api.port == 9001
+        assert agents["b"].config.api.port == base.api.port
+        assert agents["a"].config.agent.name == "a"
+        assert base.agent.name != "a"
+        assert agents["a"].config is not agents["b"].config
+
+    def test_default_session_uses_configured_region(self, monkeypatch):
+        boto3 = pytest.importorskip("boto3")
+        regions = []
+        monkeypatch.setattr(boto3, "Session", lambda region_name=None: regions.append(region_name))
+
+        base = StrandsFlowConfig()
+        base.bedrock.region_name = "eu-west-1"
+        batch.batch_spawn("p", [{"id": "a"}, {"id": "b"}], base)
+
+        assert regions == ["eu-west-1"]
+
+    def test_duplicate_id_rejected_before_any_agent_is_created(self, fake_agent):
+        with pytest.raises(ValueError, match="Duplicate agent id 'a'"):
+            batch.batch_spawn("p", [{"id": "a"}, {"id": "b"}, {"id": "a"}], boto_session=object())
+
+        assert fake_agent.created == []
+
+    def test_failed_spawn_propagates(self, fake_agent):
+        fake_agent.fail_on = "b"
+
+        with pytest.raises(RuntimeError, match="cannot create b"):
+            batch.batch_spawn("p", [{"id": "a"}, {"id": "b"}, {"id": "c"}], boto_session=object())
+
+        # The batch stops at the failing fork
+        assert [agent.config.agent.name for agent in fake_agent.created] == ["a"]
+
+    def test_empty_batch(self):
+        assert batch.batch_spawn("p", [], boto_session=object()) == {}
@@ -0,0 +1,178 @@
+"""Test suite for the StrandsFlow CLI."""
+
+import importlib
+import json
+import os
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from strandsflow.cli import _config_cache_path, _load_config
+
+MULTIAGENT_COMMANDS = ["create", "chat", "orchestrate"]
+TOP_LEVEL_COMMANDS = ["init", "chat", "config", "server", "version", "create"]
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def load_cli(monkeypatch):
+    """Import a fresh copy of the CLI module as if run with the given arguments."""
+    def load(*args, prog="strandsflow"):
+        monkeypatch.setattr(sys, "argv", [prog, *args])
+        monkeypatch.delenv("_STRANDSFLOW_COMPLETE", raising=False)
+        monkeypatch.delitem(sys.modules, "strandsflow.cli", raising=False)
+        return importlib.import_module("strandsflow.cli")
+    return load
+
+
+def command_names(typer_app):
+    return [command.name for command in typer_app.registered_commands]
+
+
+class TestSniffSubcommand:
+    """Test which commands are registered for a given command line."""
+
+    def test_help_registers_everything(self, load_cli):
+        cli = load_cli("--help")
+
+        assert cli._SUBCOMMAND is None
+        assert command_names(cli.app) == TOP_LEVEL_COMMANDS
+        assert command_names(cli.multiagent_app) == MULTIAGENT_COMMANDS
+
+        result = runner.invoke(cli.app, ["--help"])
+        assert result.exit_code == 0
+        for name in TOP_LEVEL_COMMANDS + ["multiagent"]:
+            assert name in result.output
+
+    def test_option_before_subcommand_registers_everything(self, load_cli):
+        cli = load_cli("--install-completion", "version")
+
+        assert cli._SUBCOMMAND is None
+        assert command_names(cli.app) == TOP_LEVEL_COMMANDS
+
+        result = runner.invoke(cli.app, ["version", "--help"])
+        assert result.exit_code == 0
+
+    def test_imported_module_registers_everything(self, load_cli):
+        cli = load_cli("version", prog="pytest")
+
+        assert cli._SUBCOMMAND is None
+        assert command_names(cli.app) == TOP_LEVEL_COMMANDS
+
+    def test_completion_registers_everything(self, monkeypatch):
+        monkeypatch.setenv("_STRANDSFLOW_COMPLETE", "complete_bash")
+        monkeypatch.setattr(sys, "argv", ["strandsflow", "version"])
+        monkeypatch.delitem(sys.modules, "strandsflow.cli", raising=False)
+        cli = importlib.import_module("strandsflow.cli")
+
+        assert cli._SUBCOMMAND is None
+
+    def test_top_level_command_registers_only_itself(self, load_cli):
+        cli = load_cli("version")
+
+        assert command_names(cli.app) == ["version"]
+        assert command_names(cli.multiagent_app) == []
+
+        result = runner.invoke(cli.app, ["version"])
+        assert result.exit_code == 0
+        assert "StrandsFlow" in result.output
+
+    def test_multiagent_group_registers_all_subcommands(self, load_cli):
+        cli = load_cli("multiagent", "--help")
+
+        assert command_names(cli.app) == []
+        assert command_names(cli.multiagent_app) == MULTIAGENT_COMMANDS
+
+        result = runner.invoke(cli.app, ["multiagent", "--help"])
+        assert result.exit_code == 0
+        for name in MULTIAGENT_COMMANDS:
+            assert name in result.output
+
+    @pytest.mark.parametrize("name", MULTIAGENT_COMMANDS)
+    def test_multiagent_subcommand_registers_only_itself(self, load_cli, name):
+        cli = load_cli("multiagent", name, "--help")
+
+        assert command_names(cli.app) == []
+        assert command_names(cli.multiagent_app) == [name]
+
+        result = runner.invoke(cli.app, ["multiagent", name, "--help"])
+        assert result.exit_code == 0
+        assert "Usage" in result.output
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    config_dir = tmp_path / "project"
+    config_dir.mkdir()
+    config_file = config_dir / "config.yaml"
+    config_file.write_text("bedrock:\n  region_name: us-west-2\n")
+    return config_file
+
+
+class TestLoadConfigCache:
+    """Test the parsed-configuration sidecar used by CLI commands."""
+
+    def test_sidecar_written_to_cache_dir(self, cache_home, config_file):
+        config = _load_config(str(config_file))
+
+        assert config.bedrock.region_name == "us-west-2"
+        cache_path = _config_cache_path(config_file)
+        assert cache_path.is_relative_to(cache_home)
+        assert json.loads(cache_path.read_text())["data"] == {"bedrock": {"region_name": "us-west-2"}}
+        assert [p.name for p in config_file.parent.iterdir()] == ["config.yaml"]
+
+    def test_sidecar_is_reused_while_file_unchanged(self, cache_home, config_file):
+        _load_config(str(config_file))
+        cache_path = _config_cache_path(config_file)
+        cached = json.loads(cache_path.read_text())
+        cached["data"]["bedrock"]["region_name"] = "eu-west-1"
+        cache_path.write_text(json.dumps(cached))
+
+        assert _load_config(str(config_file)).bedrock.region_name == "eu-west-1"
+
+    def test_sidecar_invalidated_when_file_changes(self, cache_home, config_file):
+        assert _load_config(str(config_file)).bedrock.region_name == "us-west-2"
+
+        config_file.write_text("bedrock:\n  region_name: ap-southeast-2\n")
+
+        assert _load_config(str(config_file)).bedrock.region_name == "ap-southeast-2"
+        cached = json.loads(_config_cache_path(config_file).read_text())
+        assert cached["data"]["bedrock"]["region_name"] == "ap-southeast-2"
+
+    def test_sidecar_invalidated_when_file_replaced(self, cache_home, config_file):
+        _load_config(str(config_file))
+        stat = config_file.stat()
+
+        # Same size and mtime, but a new file swapped in by rename
+        replacement = config_file.with_name("config.yaml.new")
+        replacement.write_text("bedrock:\n  region_name: eu-north-1\n")
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, config_file)
+
+        assert _load_config(str(config_file)).bedrock.region_name == "eu-north-1"
+
+    def test_unwritable_cache_dir_skips_caching(self, tmp_path, monkeypatch, config_file):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+
+        assert _load_config(str(config_file)).bedrock.region_name == "us-west-2"
+        assert not _config_cache_path(config_file).exists()
+
+    def test_distinct_files_get_distinct_sidecars(self, cache_home, config_file):
+        other = config_file.parent.parent / "other" / "config.yaml"
+        other.parent.mkdir()
+        other.write_text("bedrock:\n  region_name: eu-west-1\n")
+
+        assert _load_config(str(config_file)).bedrock.region_name == "us-west-2"
+        assert _load_config(str(other)).bedrock.region_name == "eu-west-1"
+        assert _config_cache_path(config_file) != _config_cache_path(other)
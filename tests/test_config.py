@@ -31,6 +31,8 @@ class TestBedrockConfig:
         assert config.temperature == DEFAULT_TEMPERATURE
         assert config.max_tokens == DEFAULT_MAX_TOKENS
         assert config.streaming is True
+        assert config.max_concurrency == 4
+        assert config.max_pool_connections == 50
     
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -60,6 +62,10 @@ class TestBedrockConfig:
         # Max tokens
         with pytest.raises(ValueError):
             BedrockConfig(max_tokens=0)
+        
+        # Concurrency limit
+        with pytest.raises(ValueError):
+            BedrockConfig(max_concurrency=0)
 
 
 class TestMCPConfig:
@@ -115,6 +121,9 @@ class TestAPIConfig:
         assert config.workers == 1
         assert config.reload is False
         assert config.cors_origins == ["*"]
+        assert config.session_ttl == 3600
+        assert config.redis_max_connections == 50
+        assert config.broadcast_batch_size == 50
     
     def test_port_validation(self):
         """Test port validation."""
@@ -190,7 +199,36 @@ class TestStrandsFlowConfig:
             
             assert loaded_config.agent.name == "Test Agent"
             assert loaded_config.bedrock.temperature == 0.5
-    
+
+    def test_yaml_reload_on_change(self):
+        """Test that a modified YAML file is parsed again."""
+        config = StrandsFlowConfig()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_path = Path(temp_dir) / "config.yaml"
+            config.save_to_file(str(yaml_path))
+            assert StrandsFlowConfig.from_file(str(yaml_path)).agent.name == config.agent.name
+
+            config.agent.name = "Renamed Agent"
+            config.save_to_file(str(yaml_path))
+
+            assert StrandsFlowConfig.from_file(str(yaml_path)).agent.name == "Renamed Agent"
+
+    def test_yaml_reload_within_same_mtime(self):
+        """Test that a rewrite keeping the old mtime is still picked up."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            yaml_path = Path(temp_dir) / "config.yaml"
+            yaml_path.write_text("agent:\n  name: First\n")
+            stat = yaml_path.stat()
+            assert StrandsFlowConfig.from_file(str(yaml_path)).agent.name == "First"
+
+            # Rewrite outside dump_yaml and restore the mtime, as a coarse
+            # filesystem timestamp would
+            yaml_path.write_text("agent:\n  name: Second Agent\n")
+            os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            assert StrandsFlowConfig.from_file(str(yaml_path)).agent.name == "Second Agent"
+
     def test_file_not_found(self):
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -0,0 +1,145 @@
+"""Test suite for StrandsFlow orchestrator routing."""
+
+import asyncio
+
+import pytest
+
+from strandsflow.multiagent.orchestrator import Orchestrator, _terms
+
+
+class FakeA2AManager:
+    """A2A manager stand-in that only records registered agents."""
+
+    def __init__(self):
+        self.agents = {}
+
+    def add_agent(self, agent, name):
+        self.agents[name] = agent
+
+
+class FakeAgent:
+    """Specialist stand-in answering with a fixed reply."""
+
+    async def chat(self, message):
+        return f"handled: {message}"
+
+
+class FakeResult:
+    message = "model routing"
+
+
+class FakeOrchestratorAgent:
+    """Orchestrator model stand-in that counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, prompt):
+        self.calls += 1
+        return FakeResult()
+
+
+def make_orchestrator(*specialists, local_routing=False):
+    orchestrator = Orchestrator(a2a_manager=FakeA2AManager(), local_routing=local_routing)
+    for name, role, capabilities in specialists:
+        orchestrator.add_specialist(name, FakeAgent(), role, capabilities)
+    return orchestrator
+
+
+SPECIALISTS = (
+    ("coder", "Software Developer", ["programming", "code_review", "debugging", "testing"]),
+    ("analyst", "Data Analyst", ["data_analysis", "statistics", "visualization"]),
+    ("writer", "Content Writer", ["writing", "editing", "content_strategy"]),
+)
+
+
+class TestTerms:
+    """Test reducing text to matchable terms."""
+
+    def test_case_and_suffixes_are_normalized(self):
+        assert _terms("Debugging") == _terms("debugged") == _terms("DEBUG")
+        assert _terms("statistics") == _terms("Statistical")
+        assert _terms("Visualizations") == _terms("visualization")
+
+    def test_stopwords_are_dropped(self):
+        assert _terms("Can you please help me with the report?") == _terms("report")
+        assert _terms("the a of and to") == frozenset()
+
+    def test_stopwords_only_match_whole_words(self):
+        assert _terms("writing") == _terms("writer")
+        assert _terms("writing") != frozenset()
+
+
+class TestRoute:
+    """Test local capability-based routing."""
+
+    @pytest.mark.parametrize("task, expected", [
+        ("Please review this code and fix the debugging output", "coder"),
+        ("Run a statistical analysis and visualize the data", "analyst"),
+        ("Edit my blog content for clarity", "writer"),
+    ])
+    def test_routes_to_best_match(self, task, expected):
+        assert make_orchestrator(*SPECIALISTS).route(task) == expected
+
+    def test_routing_ignores_case(self):
+        orchestrator = make_orchestrator(*SPECIALISTS)
+        assert orchestrator.route("STATISTICS AND VISUALIZATION") == "analyst"
+
+    def test_no_match_returns_none(self):
+        """Without a match the caller falls back to the orchestrator model."""
+        orchestrator = make_orchestrator(*SPECIALISTS)
+
+        assert orchestrator.route("What is the weather like in Paris?") is None
+        assert orchestrator.route("") is None
+        assert make_orchestrator().route("debug this code") is None
+
+    def test_filler_words_do_not_decide_the_route(self):
+        """A "help" role does not win tasks just because they ask for help."""
+        orchestrator = make_orchestrator(("support", "Help Desk", ["tickets"]), *SPECIALISTS)
+        assert orchestrator.route("Please help me with the statistics") == "analyst"
+
+    @pytest.mark.parametrize("task", ["Write a blog post", "write some copy"])
+    def test_writing_tasks_route_to_writer(self, task):
+        assert make_orchestrator(*SPECIALISTS).route(task) == "writer"
+
+    def test_tie_goes_to_first_added_specialist(self):
+        orchestrator = make_orchestrator(
+            ("first", "Reviewer", ["testing"]),
+            ("second", "Auditor", ["testing"]),
+        )
+        assert orchestrator.route("testing") == "first"
+
+    def test_cache_cleared_when_specialist_added(self):
+        orchestrator = make_orchestrator(*SPECIALISTS)
+        assert orchestrator.route("translate this to French") is None
+
+        orchestrator.add_specialist("translator", FakeAgent(), "Translator", ["translation"])
+
+        assert orchestrator.route("translate this to French") == "translator"
+
+
+class TestConditionalWorkflow:
+    """Test conditional workflows with and without local routing."""
+
+    def run_conditional(self, task, local_routing):
+        orchestrator = make_orchestrator(*SPECIALISTS, local_routing=local_routing)
+        orchestrator.orchestrator_agent = FakeOrchestratorAgent()
+        result = asyncio.run(orchestrator._execute_conditional(task))
+        return result, orchestrator.orchestrator_agent.calls
+
+    def test_local_routing_skips_the_model(self):
+        result, calls = self.run_conditional("Write a blog post", local_routing=True)
+
+        assert calls == 0
+        assert result["routed_to"] == "writer"
+        assert result["result"]["output"] == "handled: Write a blog post"
+
+    def test_local_routing_falls_back_to_model_without_match(self):
+        result, calls = self.run_conditional("What is the weather in Paris?", local_routing=True)
+
+        assert calls == 1
+        assert result["routing_decision"] == "model routing"
+
+    def test_model_routing_when_disabled(self):
+        _, calls = self.run_conditional("Write a blog post", local_routing=False)
+        assert calls == 1
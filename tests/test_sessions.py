@@ -0,0 +1,294 @@
+"""Test suite for StrandsFlow API session storage."""
+
+import asyncio
+import fnmatch
+
+from strandsflow.api.sessions import InMemorySessionStore, RedisSessionStore
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class FakePipeline:
+    """Queues commands and runs them against a FakeRedis on execute()."""
+
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args):
+            self._commands.append((name, args))
+        return queue
+
+    async def execute(self):
+        self._redis._purge()
+        commands, self._commands = self._commands, []
+        return [getattr(self._redis, f"_{name}")(*args) for name, args in commands]
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio commands the store uses.
+
+    Values are stored decoded (``decode_responses=True``) and expiry follows
+    Redis semantics, driven by the ``now`` attribute instead of wall time.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.now = 0.0
+        self.closed = False
+
+    def _purge(self):
+        for key, deadline in list(self.expiry.items()):
+            if deadline <= self.now:
+                self.data.pop(key, None)
+                del self.expiry[key]
+
+    def _delete_key(self, key):
+        self.expiry.pop(key, None)
+        return self.data.pop(key, None) is not None
+
+    @staticmethod
+    def _bounds(length, start, end):
+        start = start if start >= 0 else max(0, length + start)
+        end = end if end >= 0 else length + end
+        return start, end + 1
+
+    def _hsetnx(self, key, field, value):
+        fields = self.data.setdefault(key, {})
+        if field in fields:
+            return 0
+        fields[field] = str(value)
+        return 1
+
+    def _hincrby(self, key, field, amount=1):
+        fields = self.data.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount)
+        return int(fields[field])
+
+    def _hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def _hmget(self, key, *fields):
+        values = self.data.get(key, {})
+        return [values.get(field) for field in fields]
+
+    def _rpush(self, key, value):
+        items = self.data.setdefault(key, [])
+        items.append(value.decode() if isinstance(value, bytes) else value)
+        return len(items)
+
+    def _lrange(self, key, start, end):
+        items = self.data.get(key, [])
+        first, stop = self._bounds(len(items), start, end)
+        return items[first:stop]
+
+    def _ltrim(self, key, start, end):
+        if key in self.data:
+            self.data[key] = self._lrange(key, start, end)
+        return True
+
+    def _expire(self, key, seconds):
+        # Like Redis, EXPIRE on a missing key does nothing
+        if key not in self.data:
+            return False
+        self.expiry[key] = self.now + seconds
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def scan_iter(self, match=None, _type=None):
+        self._purge()
+        for key, value in list(self.data.items()):
+            if match is not None and not fnmatch.fnmatchcase(key, match):
+                continue
+            if _type == "HASH" and not isinstance(value, dict):
+                continue
+            yield key
+
+    async def delete(self, *keys):
+        self._purge()
+        return sum(self._delete_key(key) for key in keys)
+
+    async def aclose(self):
+        self.closed = True
+
+    def ttl(self, key):
+        self._purge()
+        if key not in self.data:
+            return -2
+        if key not in self.expiry:
+            return -1
+        return self.expiry[key] - self.now
+
+
+class TestInMemorySessionStore:
+    """Test the single-process session store."""
+
+    def test_append_and_get(self):
+        store = InMemorySessionStore()
+
+        assert run(store.append_message("s1", "hi", "hello")) == 1
+        assert run(store.append_message("s1", "again", "sure")) == 2
+
+        session = run(store.get("s1"))
+        assert session["conversation_count"] == 2
+        assert [message["user"] for message in session["messages"]] == ["hi", "again"]
+        assert run(store.get("missing")) is None
+
+    def test_get_limit(self):
+        store = InMemorySessionStore()
+        for i in range(3):
+            run(store.append_message("s1", f"u{i}", f"a{i}"))
+
+        assert len(run(store.get("s1", limit=None))["messages"]) == 3
+        assert run(store.get("s1", limit=0))["messages"] == []
+        assert [m["user"] for m in run(store.get("s1", limit=2))["messages"]] == ["u1", "u2"]
+        assert len(run(store.get("s1", limit=10))["messages"]) == 3
+
+    def test_max_messages_keeps_latest(self):
+        store = InMemorySessionStore(max_messages=2)
+        for i in range(3):
+            run(store.append_message("s1", f"u{i}", f"a{i}"))
+
+        session = run(store.get("s1"))
+        assert session["conversation_count"] == 3
+        assert [m["user"] for m in session["messages"]] == ["u1", "u2"]
+
+    def test_evicts_least_recently_used(self):
+        store = InMemorySessionStore(max_sessions=2)
+        run(store.ensure("s1"))
+        run(store.ensure("s2"))
+        run(store.append_message("s1", "hi", "hello"))
+        run(store.ensure("s3"))
+
+        assert run(store.count()) == 2
+        assert run(store.get("s2")) is None
+        assert run(store.get("s1")) is not None
+        assert [s["session_id"] for s in run(store.list_sessions())] == ["s1", "s3"]
+
+    def test_list_sessions_is_cached_and_current(self):
+        store = InMemorySessionStore()
+        run(store.append_message("s1", "hi", "hello"))
+
+        listed = run(store.list_sessions())
+        assert run(store.list_sessions()) is listed
+
+        # Summaries are updated in place, so the cached list stays current
+        run(store.append_message("s1", "again", "sure"))
+        assert run(store.list_sessions()) is listed
+        assert listed[0]["conversation_count"] == 2
+
+        # Adding a session rebuilds the list
+        run(store.ensure("s2"))
+        assert [s["session_id"] for s in run(store.list_sessions())] == ["s1", "s2"]
+
+    def test_delete_and_clear(self):
+        store = InMemorySessionStore()
+        run(store.ensure("s1"))
+        run(store.ensure("s2"))
+
+        assert run(store.delete("s1")) is True
+        assert run(store.delete("s1")) is False
+        assert [s["session_id"] for s in run(store.list_sessions())] == ["s2"]
+
+        run(store.clear())
+        assert run(store.count()) == 0
+        assert run(store.list_sessions()) == []
+
+
+class TestRedisSessionStore:
+    """Test the Redis-backed session store against an in-memory fake."""
+
+    def test_append_returns_conversation_count(self):
+        store = RedisSessionStore(FakeRedis())
+
+        assert run(store.append_message("s1", "hi", "hello")) == 1
+        assert run(store.append_message("s1", "again", "sure")) == 2
+
+        session = run(store.get("s1"))
+        assert session["conversation_count"] == 2
+        assert session["messages"][1]["agent"] == "sure"
+        assert run(store.get("missing")) is None
+
+    def test_get_limit(self):
+        store = RedisSessionStore(FakeRedis())
+        for i in range(3):
+            run(store.append_message("s1", f"u{i}", f"a{i}"))
+
+        assert len(run(store.get("s1", limit=None))["messages"]) == 3
+        assert run(store.get("s1", limit=0))["messages"] == []
+        assert [m["user"] for m in run(store.get("s1", limit=2))["messages"]] == ["u1", "u2"]
+
+    def test_max_messages_keeps_latest(self):
+        client = FakeRedis()
+        store = RedisSessionStore(client, max_messages=2)
+        for i in range(3):
+            run(store.append_message("s1", f"u{i}", f"a{i}"))
+
+        session = run(store.get("s1"))
+        assert session["conversation_count"] == 3
+        assert [m["user"] for m in session["messages"]] == ["u1", "u2"]
+        assert len(client.data["sess:s1:msgs"]) == 2
+
+    def test_list_count_delete_and_clear(self):
+        store = RedisSessionStore(FakeRedis())
+        run(store.ensure("s1"))
+        run(store.append_message("s2", "hi", "hello"))
+
+        summaries = {s["session_id"]: s for s in run(store.list_sessions())}
+        assert set(summaries) == {"s1", "s2"}
+        assert summaries["s1"]["conversation_count"] == 0
+        assert summaries["s2"]["conversation_count"] == 1
+        assert run(store.count()) == 2
+
+        assert run(store.delete("s2")) is True
+        assert run(store.delete("s2")) is False
+
+        run(store.clear())
+        assert run(store.count()) == 0
+
+    def test_ttl_expires_hash_and_messages_together(self):
+        client = FakeRedis()
+        store = RedisSessionStore(client, ttl=60)
+        run(store.ensure("s1"))
+        assert client.ttl("sess:s1") == 60
+        assert client.ttl("sess:s1:msgs") == -2
+
+        client.now = 30
+        run(store.append_message("s1", "hi", "hello"))
+        assert client.ttl("sess:s1") == 60
+        assert client.ttl("sess:s1:msgs") == 60
+
+        # Using the session again refreshes both keys
+        client.now = 80
+        run(store.ensure("s1"))
+        assert client.ttl("sess:s1") == client.ttl("sess:s1:msgs") == 60
+
+        client.now = 140
+        assert run(store.get("s1")) is None
+        assert "sess:s1" not in client.data
+        assert "sess:s1:msgs" not in client.data
+
+    def test_no_ttl_keeps_sessions(self):
+        client = FakeRedis()
+        store = RedisSessionStore(client)
+        run(store.append_message("s1", "hi", "hello"))
+
+        assert client.ttl("sess:s1") == -1
+        assert client.ttl("sess:s1:msgs") == -1
+
+    def test_close_releases_client(self):
+        client = FakeRedis()
+        run(RedisSessionStore(client).close())
+        assert client.closed is True
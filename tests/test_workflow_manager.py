@@ -0,0 +1,165 @@
+"""Test suite for StrandsFlow workflow execution tracking."""
+
+import asyncio
+
+from strandsflow.multiagent.workflow_manager import (
+    WorkflowDefinition,
+    WorkflowManager,
+    WorkflowStatus,
+    WorkflowStep
+)
+
+
+class FakeAgent:
+    """Specialist stand-in that echoes its input after an optional delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def chat(self, message: str) -> str:
+        await asyncio.sleep(self.delay)
+        return f"echo: {message}"
+
+
+class FakePool:
+    """Specialist pool stand-in holding a single agent named ``worker``."""
+
+    def __init__(self, agent: FakeAgent):
+        self.agent = agent
+
+    def get_specialist(self, name: str):
+        return self.agent if name == "worker" else None
+
+
+class FakeOrchestrator:
+    """Orchestrator stand-in without an orchestrator agent."""
+
+    orchestrator_agent = None
+
+
+def make_manager(delay: float = 0.0) -> WorkflowManager:
+    manager = WorkflowManager(FakeOrchestrator(), FakePool(FakeAgent(delay)))
+    manager.register_workflow(WorkflowDefinition(
+        name="two_steps",
+        description="Two dependent steps",
+        steps=[
+            WorkflowStep(name="first", agent="worker", input_template="{inputs.topic}"),
+            WorkflowStep(
+                name="second",
+                agent="worker",
+                input_template="{steps.first.output}",
+                depends_on=["first"]
+            )
+        ]
+    ))
+    return manager
+
+
+class TestStreamResults:
+    """Test streaming step results from a workflow execution."""
+
+    def test_streams_all_steps_and_completes(self):
+        """Streaming must not break the running workflow."""
+        async def scenario():
+            manager = make_manager()
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            streamed = [item async for item in manager.stream_results(execution_id, timeout=5)]
+            execution = await manager.wait_for_completion(execution_id, timeout=5)
+            return manager, execution, streamed
+
+        manager, execution, streamed = asyncio.run(scenario())
+
+        assert [name for name, _ in streamed] == ["first", "second"]
+        assert all(result["status"] == "success" for _, result in streamed)
+        assert execution.status == WorkflowStatus.COMPLETED
+        assert execution.error is None
+
+    def test_finished_execution_releases_tracking_state(self):
+        """Completion events and step queues are dropped once a workflow ends."""
+        async def scenario():
+            manager = make_manager()
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            await manager.wait_for_completion(execution_id, timeout=5)
+            await asyncio.sleep(0)
+            return manager, execution_id
+
+        manager, execution_id = asyncio.run(scenario())
+
+        assert manager._completion_events == {}
+        assert manager._step_queues == {}
+        assert manager.executions[execution_id].status == WorkflowStatus.COMPLETED
+
+    def test_streaming_finished_execution_yields_recorded_steps(self):
+        async def scenario():
+            manager = make_manager()
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            await manager.wait_for_completion(execution_id, timeout=5)
+            await asyncio.sleep(0)
+            return [name async for name, _ in manager.stream_results(execution_id)]
+
+        assert asyncio.run(scenario()) == ["first", "second"]
+
+    def test_timeout_is_an_overall_deadline(self):
+        """Each step finishing inside the timeout must not extend the stream."""
+        async def scenario():
+            manager = make_manager(delay=0.3)
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            streamed = [name async for name, _ in manager.stream_results(execution_id, timeout=0.45)]
+            return streamed, loop.time() - started
+
+        streamed, elapsed = asyncio.run(scenario())
+
+        assert streamed == ["first"]
+        assert elapsed < 0.6
+
+
+class TestWaitForCompletion:
+    """Test waiting on a workflow execution."""
+
+    def test_returns_completed_execution(self):
+        async def scenario():
+            manager = make_manager()
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            return await manager.wait_for_completion(execution_id, timeout=5)
+
+        execution = asyncio.run(scenario())
+
+        assert execution.status == WorkflowStatus.COMPLETED
+        assert set(execution.results["steps"]) == {"first", "second"}
+
+    def test_timeout_returns_execution_still_running(self):
+        async def scenario():
+            manager = make_manager(delay=0.3)
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            execution = await manager.wait_for_completion(execution_id, timeout=0.05)
+            elapsed = loop.time() - started
+            status = execution.status
+            # The workflow keeps running after the wait gives up
+            finished = await manager.wait_for_completion(execution_id, timeout=5)
+            return status, elapsed, finished.status
+
+        status, elapsed, final_status = asyncio.run(scenario())
+
+        assert status == WorkflowStatus.RUNNING
+        assert elapsed < 0.25
+        assert final_status == WorkflowStatus.COMPLETED
+
+    def test_unknown_execution_id_returns_none(self):
+        async def scenario():
+            return await make_manager().wait_for_completion("missing", timeout=0.05)
+
+        assert asyncio.run(scenario()) is None
+
+    def test_finished_execution_returns_immediately(self):
+        async def scenario():
+            manager = make_manager()
+            execution_id = await manager.execute_workflow("two_steps", {"topic": "ai"})
+            await manager.wait_for_completion(execution_id, timeout=5)
+            await asyncio.sleep(0)
+            return await manager.wait_for_completion(execution_id)
+
+        assert asyncio.run(scenario()).status == WorkflowStatus.COMPLETED